@@ -1,24 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# ✅ Importa tus módulos existentes
-from cuadrados_medios1 import CuadradosMediosApp
-from Productos_Medios2 import ProductosMediosApp
-from Multiplicador_Constante3 import MultiplicadorConstanteApp
-
-from prueba_kerland import PruebaKerlandApp
-# ✅ Importa el generador exponencial
-from exponencial import ExponencialApp
-
-# ✅ Importa el Generador Uniforme (ajusta el nombre del archivo si es diferente)
-from generador_uniforme import GeneradorUniformeApp  # <-- Asegúrate de que este archivo exista
-from generador_gamma import GammaApp
-from generador_normal import GeneradorNormalApp
-from generador_weibull import GeneradorWeibullApp
-from generador_uniforme2 import GeneradorUniforme2App
-from generador_bernoulli import GeneradorBernoulliApp
-from generador_binomial import GeneradorBinomialApp
-from generador_poisson import GeneradorPoissonApp
+# ✅ Los módulos de las calculadoras (y con ellos numpy, scipy y matplotlib) se importan
+# recién al abrir cada ventana: el menú arranca solo con tkinter
 
 class MenuCalculadorasApp:
     def __init__(self, root):
@@ -167,16 +151,19 @@ class MenuCalculadorasApp:
         ).pack(pady=20, fill=tk.X, padx=20)
 
     def abrir_cuadrados_medios(self):
+        from cuadrados_medios1 import CuadradosMediosApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Algoritmo de Cuadrados Medios")
         app = CuadradosMediosApp(ventana)
 
     def abrir_productos_medios(self):
+        from Productos_Medios2 import ProductosMediosApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Algoritmo de Productos Medios")
         app = ProductosMediosApp(ventana)
 
     def abrir_multiplicador_constante(self):
+        from Multiplicador_Constante3 import MultiplicadorConstanteApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Algoritmo de Multiplicador Constante")
         app = MultiplicadorConstanteApp(ventana)
@@ -185,51 +172,61 @@ class MenuCalculadorasApp:
 
     # ✅ Método para abrir el Generador Uniforme
     def abrir_generador_uniforme(self):
+        from generador_uniforme import GeneradorUniformeApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Uniformes")
         app = GeneradorUniformeApp(ventana)
 
     def abrir_prueba_kerlan(self):
+        from prueba_kerland import PruebaKerlandApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Prueba Kerlan - k*ERLANG")
         app = PruebaKerlandApp(ventana)
 
     def abrir_exponencial(self):
+        from exponencial import ExponencialApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Exponenciales")
         app = ExponencialApp(ventana)
 
     def abrir_generador_gamma(self):
+        from generador_gamma import GammaApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Gamma")
         app = GammaApp(ventana)
 
     def abrir_generador_normal(self):
+        from generador_normal import GeneradorNormalApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Normales")
         app = GeneradorNormalApp(ventana)
 
     def abrir_generador_weibull(self):
+        from generador_weibull import GeneradorWeibullApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Weibull")
         app = GeneradorWeibullApp(ventana)
 
     def abrir_generador_uniforme2(self):
+        from generador_uniforme2 import GeneradorUniforme2App
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Uniformes2")
         app = GeneradorUniforme2App(ventana)
         
     def abrir_generador_bernoulli(self):
+        from generador_bernoulli import GeneradorBernoulliApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Bernoulli")
         app = GeneradorBernoulliApp(ventana)
 
     def abrir_generador_binomial(self):
+        from generador_binomial import GeneradorBinomialApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Binomial")
         app = GeneradorBinomialApp(ventana)
 
     def abrir_generador_poisson(self):
+        from generador_poisson import GeneradorPoissonApp
         ventana = tk.Toplevel(self.root)
         ventana.title("Generador de Números Poisson")
         app = GeneradorPoissonApp(ventana)
@@ -1,5 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tabla_virtual import TablaVirtual
+from segundo_plano import TareaEnSegundoPlano
+from atlas_semillas import RUTA_MULTIPLICADOR, cargar_atlas, constante_en_atlas, describir_registro, mejores_semillas
+from metodos_clasicos import iter_multiplicador_constante, estado_multiplicador, validar_digitos
 
 class MultiplicadorConstanteApp:
     def __init__(self, root):
@@ -30,6 +34,8 @@ class MultiplicadorConstanteApp:
         self.constante_var = tk.StringVar()
         self.semilla_var = tk.StringVar()
         self.iteraciones_var = tk.StringVar()
+        self.inicio_var = tk.StringVar(value="0")
+        self.digitos_var = tk.StringVar(value="4")
 
         # Crear widgets
         self.create_widgets()
@@ -112,6 +118,48 @@ class MultiplicadorConstanteApp:
         )
         iteraciones_entry.grid(row=2, column=1, padx=10, pady=5)
 
+        # Etiqueta y entrada para la iteración inicial (salto en O(log k))
+        tk.Label(
+            input_frame,
+            text="Iteración inicial (k):",
+            font=("Arial", 11),
+            bg="#919191",
+            fg="#2E2E2E"
+        ).grid(row=3, column=0, sticky="w", padx=10, pady=5)
+
+        inicio_entry = tk.Entry(
+            input_frame,
+            textvariable=self.inicio_var,
+            width=20,
+            font=("Arial", 10),
+            relief="solid",
+            bd=2,
+            bg="white",
+            fg="black"
+        )
+        inicio_entry.grid(row=3, column=1, padx=10, pady=5)
+
+        # Etiqueta y entrada para el número de dígitos centrales
+        tk.Label(
+            input_frame,
+            text="Dígitos centrales (D):",
+            font=("Arial", 11),
+            bg="#919191",
+            fg="#2E2E2E"
+        ).grid(row=4, column=0, sticky="w", padx=10, pady=5)
+
+        digitos_entry = tk.Entry(
+            input_frame,
+            textvariable=self.digitos_var,
+            width=20,
+            font=("Arial", 10),
+            relief="solid",
+            bd=2,
+            bg="white",
+            fg="black"
+        )
+        digitos_entry.grid(row=4, column=1, padx=10, pady=5)
+
         # Botones inferiores
         button_frame = tk.Frame(self.root, bg="#858482")
         button_frame.pack(pady=15)
@@ -130,15 +178,33 @@ class MultiplicadorConstanteApp:
             style="TButton"
         ).pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="🔎 Consultar atlas",
+            command=self.consultar_atlas,
+            style="TButton"
+        ).pack(side=tk.LEFT, padx=5)
+
         ttk.Button(
             button_frame,
             text="❌ Salir",
             command=self.root.quit,
             style="TButton"
         ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame,
+            text="⛔ Cancelar",
+            command=self.cancelar_generacion,
+            style="TButton"
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Progreso de la generación en segundo plano
+        self.barra_progreso = ttk.Progressbar(button_frame, length=150, mode="determinate")
+        self.barra_progreso.pack(side=tk.LEFT, padx=5)
+        self.tarea = TareaEnSegundoPlano(self.root, self.barra_progreso)
 
         # Tabla con Treeview
-        self.tree = ttk.Treeview(
+        self.tree = TablaVirtual(
             self.root,
             columns=("N", "a", "Y_i", "Producto", "X_{i+1}", "R_i"),
             show="headings",
@@ -174,53 +240,78 @@ class MultiplicadorConstanteApp:
             a = int(self.constante_var.get())
             semilla = int(self.semilla_var.get())
             n = int(self.iteraciones_var.get())
+            inicio = int(self.inicio_var.get() or 0)
+            digitos = validar_digitos(self.digitos_var.get() or 4)
 
             if a <= 0 or semilla <= 0 or n <= 0:
                 raise ValueError("La constante, semilla y iteraciones deben ser números positivos.")
+            if inicio < 0:
+                raise ValueError("La iteración inicial no puede ser negativa.")
 
-            # Limpiar tabla
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            self.tree.limpiar()
+            inicial = {}
 
-            y = semilla
-            for i in range(n):
-                # Calcular producto
-                producto = a * y
-                str_producto = str(producto)
+            def bloques():
+                # El estado inicial también se calcula en el hilo trabajador (O(k) con D distinto de 4)
+                inicial["y"] = estado_multiplicador(a, semilla, inicio, digitos)
+                yield from iter_multiplicador_constante(a, semilla, n, inicio=inicio, digitos=digitos)
 
-                # Regla: asegurar que tenga 8 dígitos
-                while len(str_producto) < 8:
-                    str_producto = '0' + str_producto
+            def mostrar(x_valores, r_valores, cancelada=False):
+                # Y_i es el X anterior (o el estado tras 'inicio' pasos en la primera fila)
+                y = lambda i: int(x_valores[i - 1]) if i else inicial["y"]
 
-                # Tomar 4 dígitos centrales
-                medio = len(str_producto) // 2
-                x_str = str_producto[medio - 2:medio + 2]
-                x_num = int(x_str)
-
-                # Calcular R_i
-                r = x_num / 10000.0
-
-                # Insertar fila en la tabla
-                self.tree.insert("", tk.END, values=(
-                    i + 1,
+                # La tabla virtual solo formatea las filas visibles (producto con al menos 2D dígitos)
+                self.tree.cargar(
+                    range(inicio + 1, inicio + len(x_valores) + 1),
                     a,
                     y,
-                    str_producto,
-                    x_num,
-                    f"{r:.4f}"
-                ))
+                    lambda i: a * y(i),
+                    x_valores,
+                    r_valores,
+                    formatos=("", "", "", f"0{2 * digitos}d", "", f".{digitos}f"),
+                    reiniciar=False
+                )
 
-                # Actualizar Y para la próxima iteración
-                y = x_num
+            # Generar en segundo plano con el núcleo sin Tk (aritmética entera), por bloques
+            self.tarea.iniciar(bloques(), n, al_avanzar=mostrar, al_terminar=mostrar)
 
         except ValueError as e:
             messagebox.showerror("Error", f"Entrada inválida: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error: {e}")
 
+    def cancelar_generacion(self):
+        self.tarea.cancelar()
+
     def limpiar_tabla(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tarea.cancelar()
+        self.tree.limpiar()
+
+    def consultar_atlas(self):
+        try:
+            a = int(self.constante_var.get())
+            semilla = int(self.semilla_var.get())
+            if not 0 < a < 10000 or not 0 < semilla < 10000:
+                raise ValueError("El atlas solo cubre constantes y semillas de 4 dígitos (1 a 9999).")
+            atlas, metadatos = cargar_atlas(RUTA_MULTIPLICADOR)
+        except FileNotFoundError:
+            messagebox.showwarning("Atlas", "No existe el atlas. Ejecuta primero: python atlas_semillas.py")
+            return
+        except ValueError as e:
+            messagebox.showerror("Error", f"Entrada inválida: {e}")
+            return
+        if not constante_en_atlas(metadatos, a):
+            messagebox.showwarning(
+                "Atlas",
+                f"El atlas todavía no incluye la constante a={a}. "
+                f"Ejecuta: python atlas_semillas.py --desde {a} --hasta {a}"
+            )
+            return
+
+        fila = atlas[a]
+        texto = describir_registro(fila[semilla], metadatos)
+        texto += f"\n\nMejores semillas para a={a}: {mejores_semillas(fila)}"
+        messagebox.showinfo("Atlas de semillas", texto)
 
 
 # Ejecutar la aplicación
@@ -1,9 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import gaussian_kde
+from tabla_virtual import TablaVirtual
+from segundo_plano import TareaEnSegundoPlano
+from metodos_clasicos import (iter_productos_medios, estado_productos_medios, muestra_ponderada_productos_medios,
+                              ciclo_productos_medios, longitud_util_productos_medios, validar_digitos)
+from pruebas_estadisticas import CacheResultados, chi_varianza, chi_uniformidad, texto_sensibilidad, M_FINO
 
 class ProductosMediosApp:
     def __init__(self, root):
@@ -34,6 +36,15 @@ class ProductosMediosApp:
         self.semilla1_var = tk.StringVar()
         self.semilla2_var = tk.StringVar()
         self.iteraciones_var = tk.StringVar()
+        self.inicio_var = tk.StringVar(value="0")
+        self.digitos_var = tk.StringVar(value="4")
+        self.detener_var = tk.BooleanVar(value=True)
+
+        # Parámetros (semillas, n, inicio, D) de la última generación
+        self.parametros = None
+
+        # Resultados de las pruebas ya calculados para los datos actuales
+        self.cache_pruebas = CacheResultados()
 
         # Crear widgets
         self.create_widgets()
@@ -116,6 +127,59 @@ class ProductosMediosApp:
         )
         iteraciones_entry.grid(row=2, column=1, padx=10, pady=5)
 
+        # Etiqueta y entrada para la iteración inicial (salto en O(log k))
+        tk.Label(
+            input_frame,
+            text="Iteración inicial (k):",
+            font=("Arial", 11),
+            bg="#8A8B8A",
+            fg="white"
+        ).grid(row=3, column=0, sticky="w", padx=10, pady=5)
+
+        inicio_entry = tk.Entry(
+            input_frame,
+            textvariable=self.inicio_var,
+            width=20,
+            font=("Arial", 10),
+            relief="solid",
+            bd=2,
+            bg="white",
+            fg="black"
+        )
+        inicio_entry.grid(row=3, column=1, padx=10, pady=5)
+
+        # Etiqueta y entrada para el número de dígitos centrales
+        tk.Label(
+            input_frame,
+            text="Dígitos centrales (D):",
+            font=("Arial", 11),
+            bg="#8A8B8A",
+            fg="white"
+        ).grid(row=4, column=0, sticky="w", padx=10, pady=5)
+
+        digitos_entry = tk.Entry(
+            input_frame,
+            textvariable=self.digitos_var,
+            width=20,
+            font=("Arial", 10),
+            relief="solid",
+            bd=2,
+            bg="white",
+            fg="black"
+        )
+        digitos_entry.grid(row=4, column=1, padx=10, pady=5)
+
+        # Detener la generación cuando la sucesión degenera (entra en su ciclo)
+        tk.Checkbutton(
+            input_frame,
+            text="Detener al degenerar",
+            variable=self.detener_var,
+            font=("Arial", 11),
+            bg="#8A8B8A",
+            fg="white",
+            selectcolor="#888A88"
+        ).grid(row=5, column=0, columnspan=2, sticky="w", padx=10, pady=5)
+
         # Botones inferiores
         button_frame = tk.Frame(self.root, bg="#858685")
         button_frame.pack(pady=15)
@@ -140,9 +204,20 @@ class ProductosMediosApp:
             command=self.root.quit,
             style="TButton"
         ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame,
+            text="⛔ Cancelar",
+            command=self.cancelar_generacion,
+            style="TButton"
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Progreso de la generación en segundo plano
+        self.barra_progreso = ttk.Progressbar(button_frame, length=150, mode="determinate")
+        self.barra_progreso.pack(side=tk.LEFT, padx=5)
+        self.tarea = TareaEnSegundoPlano(self.root, self.barra_progreso)
 
         # Tabla con Treeview
-        self.tree = ttk.Treeview(
+        self.tree = TablaVirtual(
             self.root,
             columns=("N", "Y_{i-1}", "Y_i", "Producto", "X_{i+1}", "R_i"),
             show="headings",
@@ -203,67 +278,87 @@ class ProductosMediosApp:
             semilla1 = int(self.semilla1_var.get())
             semilla2 = int(self.semilla2_var.get())
             n = int(self.iteraciones_var.get())
+            inicio = int(self.inicio_var.get() or 0)
+            digitos = validar_digitos(self.digitos_var.get() or 4)
 
             if semilla1 <= 0 or semilla2 <= 0 or n <= 0:
                 raise ValueError("Las semillas y las iteraciones deben ser números positivos.")
-
-            # Limpiar tabla
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            y_prev = semilla1
-            y_curr = semilla2
-
-            for i in range(n):
-                # Calcular producto
-                producto = y_prev * y_curr
-                str_producto = str(producto)
-
-                # Regla: si longitud impar → agregar cero adelante
-                if len(str_producto) % 2 == 1:
-                    str_producto = '0' + str_producto
-
-                # Tomar 4 dígitos centrales
-                medio = len(str_producto) // 2
-                x_str = str_producto[medio - 2:medio + 2]
-                x_num = int(x_str)
-
-                # Calcular R_i
-                r = x_num / 10000.0
-
-                # Insertar fila en la tabla
-                self.tree.insert("", tk.END, values=(
-                    i + 1,
-                    y_prev,
-                    y_curr,
-                    producto,
-                    x_num,
-                    f"{r:.4f}"
-                ))
-
-                # Actualizar para la próxima iteración
-                y_prev = y_curr
-                y_curr = x_num
+            if inicio < 0:
+                raise ValueError("La iteración inicial no puede ser negativa.")
+
+            self.tree.limpiar()
+            self.parametros = None
+            self.cache_pruebas.limpiar()
+            detener = self.detener_var.get()
+            inicial = {}
+
+            def bloques():
+                # La órbita (estado inicial) y el ciclo también se calculan en el hilo trabajador
+                inicial["par"] = estado_productos_medios(semilla1, semilla2, inicio, digitos)
+                total = n
+                if detener:
+                    # Una sola búsqueda del ciclo: da el mensaje y cuántos X_i generar
+                    inicial["ciclo"] = ciclo_productos_medios(semilla1, semilla2, digitos, bitset=True)
+                    total = min(n, longitud_util_productos_medios(semilla1, semilla2, inicio, digitos,
+                                                                  inicial["ciclo"]))
+                yield from iter_productos_medios(semilla1, semilla2, total, inicio=inicio, digitos=digitos)
+
+            def mostrar(x_valores, r_valores):
+                # Sucesión Z = (Y_{i-1}, Y_i del primer renglón, X_1, X_2, ...)
+                z = lambda j: inicial["par"][j] if j < 2 else int(x_valores[j - 2])
+
+                # La tabla virtual solo formatea las filas visibles
+                self.tree.cargar(
+                    range(inicio + 1, inicio + len(x_valores) + 1),
+                    z,
+                    lambda i: z(i + 1),
+                    lambda i: z(i) * z(i + 1),
+                    x_valores,
+                    r_valores,
+                    formatos=("", "", "", "", "", f".{digitos}f"),
+                    reiniciar=False
+                )
+
+            def terminar(x_valores, r_valores, cancelada):
+                mostrar(x_valores, r_valores)
+                self.parametros = (semilla1, semilla2, len(x_valores), inicio, digitos)
+                if not cancelada and len(x_valores) < n:
+                    cola, periodo = inicial["ciclo"]
+                    messagebox.showinfo(
+                        "Sucesión degenerada",
+                        f"La sucesión entra en un ciclo de periodo {periodo} tras una cola de {cola} pares.\n"
+                        f"Se generaron {len(x_valores)} de {n} números; el resto solo repetiría el ciclo."
+                    )
+
+            # Generar en segundo plano con el núcleo sin Tk (aritmética entera), por bloques
+            self.tarea.iniciar(bloques(), n, al_avanzar=mostrar, al_terminar=terminar)
 
         except ValueError as e:
             messagebox.showerror("Error", f"Entrada inválida: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error: {e}")
 
+    def cancelar_generacion(self):
+        self.tarea.cancelar()
+
     def limpiar_tabla(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tarea.cancelar()
+        self.tree.limpiar()
+        self.cache_pruebas.limpiar()
+        self.parametros = None
+
+    def _muestra_ponderada(self):
+        """R_i distintos y sus repeticiones, calculados desde la cola y el ciclo en O(periodo)."""
+        parametros = self.parametros
+        return self.cache_pruebas.muestra(parametros, lambda: muestra_ponderada_productos_medios(*parametros))
 
     def prueba_medias(self):
-        items = self.tree.get_children()
-        if not items:
+        if self.parametros is None:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
-        r_values = []
-        for item in items:
-            r_str = self.tree.item(item, 'values')[5]  # Columna R_i (índice 5)
-            r_values.append(float(r_str))
+        # R_i distintos con sus repeticiones (cola + ciclo), sin leer la tabla
+        r_values, pesos = self._muestra_ponderada()
 
         # Crear nueva ventana
         ventana_prueba = tk.Toplevel(self.root)
@@ -357,12 +452,9 @@ class ProductosMediosApp:
 
         # Función para ejecutar la prueba
         def ejecutar_prueba(text_widget, z_value):
-            n = len(r_values)
-            media_calculado = sum(r_values) / n
-            error_estandar = 1 / math.sqrt(12 * n)
-            li_r = 0.5 - z_value * error_estandar
-            ls_r = 0.5 + z_value * error_estandar
-            aceptado = li_r <= media_calculado <= ls_r
+            resultado = self.cache_pruebas.evaluar(r_values, pesos=pesos)
+            n, media_calculado = resultado.n, resultado.media
+            li_r, ls_r, aceptado = resultado.prueba_medias(z_value)
 
             # ✅ FORMATO CORREGIDO (SIN ERRORES)
             output = (
@@ -400,10 +492,10 @@ class ProductosMediosApp:
 
             # Histograma
             n_bins = 10
-            counts, bins, patches = ax.hist(r_values, bins=n_bins, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
+            counts, bins, patches = ax.hist(r_values, bins=n_bins, weights=pesos, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
 
             # KDE
-            kde = gaussian_kde(r_values)
+            kde = gaussian_kde(r_values, weights=pesos)
             x = np.linspace(0, 1, 100)
             ax.plot(x, kde(x), color='darkorange', linewidth=2, label='Densidad Observada (KDE)')
 
@@ -428,12 +520,9 @@ class ProductosMediosApp:
 
         # Función para exportar a txt
         def exportar_a_txt(r_values, z_value):
-            n = len(r_values)
-            media_calculado = sum(r_values) / n
-            error_estandar = 1 / math.sqrt(12 * n)
-            li_r = 0.5 - z_value * error_estandar
-            ls_r = 0.5 + z_value * error_estandar
-            aceptado = li_r <= media_calculado <= ls_r
+            resultado = self.cache_pruebas.evaluar(r_values, pesos=pesos)
+            n, media_calculado = resultado.n, resultado.media
+            li_r, ls_r, aceptado = resultado.prueba_medias(z_value)
 
             output = (
                 "Resultados de la Prueba de Medias:\n\n"
@@ -462,15 +551,12 @@ class ProductosMediosApp:
         # No ejecutar automáticamente
 
     def prueba_varianza(self):
-        items = self.tree.get_children()
-        if not items:
+        if self.parametros is None:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
-        r_values = []
-        for item in items:
-            r_str = self.tree.item(item, 'values')[5]  # Columna R_i (índice 5)
-            r_values.append(float(r_str))
+        # R_i distintos con sus repeticiones (cola + ciclo), sin leer la tabla
+        r_values, pesos = self._muestra_ponderada()
 
         # Crear nueva ventana
         ventana_prueba = tk.Toplevel(self.root)
@@ -657,56 +743,16 @@ class ProductosMediosApp:
 
         # Función interna para ejecutar la prueba
         def ejecutar_prueba(text_widget, modo, confianza, chi_alpha_2_manual, chi_1_minus_alpha_2_manual):
-            n = len(r_values)
-            media = sum(r_values) / n
-            varianza_muestra = sum((x - media) ** 2 for x in r_values) / (n - 1)
+            resultado = self.cache_pruebas.evaluar(r_values, pesos=pesos)
+            n = resultado.n
             df = n - 1
 
-            # ✅ TABLA DE CHI-CUADRADA COMPLETA (SEGÚN TU PDF)
-            chi_tabla = {
-                1: (0.000157, 3.8415),
-                2: (0.010025, 5.9915),
-                3: (0.071721, 7.8147),
-                4: (0.20700, 9.4877),
-                5: (0.41174, 11.0705),
-                6: (0.67573, 12.5916),
-                7: (0.98926, 14.0671),
-                8: (1.3444, 15.5073),
-                9: (1.7349, 16.9190),
-                10: (2.1559, 18.3070),
-                11: (2.6032, 19.6752),
-                12: (3.0738, 21.0261),
-                13: (3.5650, 22.3620),
-                14: (4.0747, 23.6848),
-                15: (4.6009, 24.9958),
-                16: (5.1422, 26.2962),
-                17: (5.6972, 27.5871),
-                18: (6.2621, 28.8693),
-                19: (6.8351, 30.1435),
-                20: (7.4140, 31.4104),
-                21: (7.9962, 32.6706),
-                22: (8.5834, 33.9245),
-                23: (9.1745, 35.1725),
-                24: (9.7684, 36.4150),
-                25: (10.365, 37.6525),
-                26: (10.965, 38.8851),
-                27: (11.568, 40.1133),
-                28: (12.173, 41.3372),
-                29: (12.781, 42.5569),
-                30: (13.392, 43.7730)
-            }
-
             if modo == "automático":
                 # Calcular alpha desde el nivel de confianza
                 alpha = 1 - confianza
 
                 # Obtener valores críticos de Chi-cuadrada
-                if df in chi_tabla:
-                    chi_alpha_2 = chi_tabla[df][0]  # χ²(α/2, n-1)
-                    chi_1_minus_alpha_2 = chi_tabla[df][1]  # χ²(1-α/2, n-1)
-                else:
-                    chi_alpha_2 = 0.0
-                    chi_1_minus_alpha_2 = float('inf')
+                chi_alpha_2, chi_1_minus_alpha_2 = chi_varianza(df, confianza)
 
             else:  # Modo manual
                 try:
@@ -717,11 +763,7 @@ class ProductosMediosApp:
                     return
 
             # ✅ FÓRMULA CORRECTA: LI = χ²(α/2) / (12 * df), LS = χ²(1-α/2) / (12 * df)
-            li_v = chi_alpha_2 / (12 * df)
-            ls_v = chi_1_minus_alpha_2 / (12 * df)
-
-            # Conclusión
-            aceptado = li_v <= varianza_muestra <= ls_v
+            li_v, ls_v, aceptado = resultado.prueba_varianza(chi_alpha_2, chi_1_minus_alpha_2)
 
             # Formato de salida
             output = (
@@ -758,10 +800,10 @@ class ProductosMediosApp:
 
             # Histograma
             n_bins = 10
-            counts, bins, patches = ax.hist(r_values, bins=n_bins, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
+            counts, bins, patches = ax.hist(r_values, bins=n_bins, weights=pesos, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
 
             # KDE
-            kde = gaussian_kde(r_values)
+            kde = gaussian_kde(r_values, weights=pesos)
             x = np.linspace(0, 1, 100)
             ax.plot(x, kde(x), color='darkorange', linewidth=2, label='Densidad Observada (KDE)')
 
@@ -786,59 +828,18 @@ class ProductosMediosApp:
 
         # Función para exportar a txt
         def exportar_a_txt(r_values, modo, confianza, chi_alpha_2_manual, chi_1_minus_alpha_2_manual):
-            n = len(r_values)
-            media = sum(r_values) / n
-            varianza_muestra = sum((x - media) ** 2 for x in r_values) / (n - 1)
+            resultado = self.cache_pruebas.evaluar(r_values, pesos=pesos)
+            n = resultado.n
             df = n - 1
 
-            chi_tabla = {
-                1: (0.000157, 3.8415),
-                2: (0.010025, 5.9915),
-                3: (0.071721, 7.8147),
-                4: (0.20700, 9.4877),
-                5: (0.41174, 11.0705),
-                6: (0.67573, 12.5916),
-                7: (0.98926, 14.0671),
-                8: (1.3444, 15.5073),
-                9: (1.7349, 16.9190),
-                10: (2.1559, 18.3070),
-                11: (2.6032, 19.6752),
-                12: (3.0738, 21.0261),
-                13: (3.5650, 22.3620),
-                14: (4.0747, 23.6848),
-                15: (4.6009, 24.9958),
-                16: (5.1422, 26.2962),
-                17: (5.6972, 27.5871),
-                18: (6.2621, 28.8693),
-                19: (6.8351, 30.1435),
-                20: (7.4140, 31.4104),
-                21: (7.9962, 32.6706),
-                22: (8.5834, 33.9245),
-                23: (9.1745, 35.1725),
-                24: (9.7684, 36.4150),
-                25: (10.365, 37.6525),
-                26: (10.965, 38.8851),
-                27: (11.568, 40.1133),
-                28: (12.173, 41.3372),
-                29: (12.781, 42.5569),
-                30: (13.392, 43.7730)
-            }
-
             if modo == "automático":
                 alpha = 1 - confianza
-                if df in chi_tabla:
-                    chi_alpha_2 = chi_tabla[df][0]
-                    chi_1_minus_alpha_2 = chi_tabla[df][1]
-                else:
-                    chi_alpha_2 = 0.0
-                    chi_1_minus_alpha_2 = float('inf')
+                chi_alpha_2, chi_1_minus_alpha_2 = chi_varianza(df, confianza)
             else:
                 chi_alpha_2 = chi_alpha_2_manual
                 chi_1_minus_alpha_2 = chi_1_minus_alpha_2_manual
 
-            li_v = chi_alpha_2 / (12 * df)
-            ls_v = chi_1_minus_alpha_2 / (12 * df)
-            aceptado = li_v <= varianza_muestra <= ls_v
+            li_v, ls_v, aceptado = resultado.prueba_varianza(chi_alpha_2, chi_1_minus_alpha_2)
 
             output = (
                 f"Resultados de la Prueba de Varianza (Modo {modo.capitalize()}):\n\n"
@@ -870,15 +871,14 @@ class ProductosMediosApp:
         toggle_campos()
 
     def prueba_uniformidad(self):
-        items = self.tree.get_children()
-        if not items:
+        if self.parametros is None:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
-        r_values = []
-        for item in items:
-            r_str = self.tree.item(item, 'values')[5]  # Columna R_i (índice 5)
-            r_values.append(float(r_str))
+        # R_i distintos con sus repeticiones (cola + ciclo), sin leer la tabla
+        r_values, pesos = self._muestra_ponderada()
+        # Histograma fino: cualquier m que lo divida se agrupa sin volver a recorrer los datos
+        fino = self.cache_pruebas.evaluar(r_values, M_FINO, pesos=pesos)
 
         # Crear nueva ventana
         ventana_prueba = tk.Toplevel(self.root)
@@ -996,66 +996,19 @@ class ProductosMediosApp:
 
         # Función interna para ejecutar la prueba
         def ejecutar_prueba(text_widget, m, confianza):
-            n = len(r_values)
+            # Frecuencias observadas (ponderadas por repeticiones) agrupando el histograma fino
+            resultado = self.cache_pruebas.con_intervalos(fino, r_values, m, pesos)
+            n = resultado.n
             alpha = 1 - confianza
             df = m - 1
 
             # Frecuencia esperada
-            e = n / m
-
-            # Contar frecuencias observadas
-            o = [0] * m
-            for r in r_values:
-                intervalo = int(r * m)
-                if intervalo == m:
-                    intervalo = m - 1
-                o[intervalo] += 1
-
-            # Calcular chi-cuadrada
-            chi_cuadrada_calculada = sum((oi - e) ** 2 / e for oi in o)
-
-            # Tabla de Chi-cuadrada (predefinida)
-            chi_tabla = {
-                1: (0.000157, 3.8415),
-                2: (0.010025, 5.9915),
-                3: (0.071721, 7.8147),
-                4: (0.20700, 9.4877),
-                5: (0.41174, 11.0705),
-                6: (0.67573, 12.5916),
-                7: (0.98926, 14.0671),
-                8: (1.3444, 15.5073),
-                9: (1.7349, 16.9190),
-                10: (2.1559, 18.3070),
-                11: (2.6032, 19.6752),
-                12: (3.0738, 21.0261),
-                13: (3.5650, 22.3620),
-                14: (4.0747, 23.6848),
-                15: (4.6009, 24.9958),
-                16: (5.1422, 26.2962),
-                17: (5.6972, 27.5871),
-                18: (6.2621, 28.8693),
-                19: (6.8351, 30.1435),
-                20: (7.4140, 31.4104),
-                21: (7.9962, 32.6706),
-                22: (8.5834, 33.9245),
-                23: (9.1745, 35.1725),
-                24: (9.7684, 36.4150),
-                25: (10.365, 37.6525),
-                26: (10.965, 38.8851),
-                27: (11.568, 40.1133),
-                28: (12.173, 41.3372),
-                29: (12.781, 42.5569),
-                30: (13.392, 43.7730)
-            }
-
-            # Obtener valor crítico de Chi-cuadrada
-            if df in chi_tabla:
-                chi_tabla_valor = chi_tabla[df][1]  # χ²(α, df)
-            else:
-                chi_tabla_valor = float('inf')
+            e = resultado.esperada
+            o = resultado.frecuencias.tolist()
 
-            # Conclusión
-            aceptado = chi_cuadrada_calculada <= chi_tabla_valor
+            # Valor crítico de Chi-cuadrada y conclusión
+            chi_tabla_valor = chi_uniformidad(df, confianza)
+            chi_cuadrada_calculada, aceptado = resultado.prueba_uniformidad(chi_tabla_valor)
 
             # Formato de salida
             output = (
@@ -1087,6 +1040,7 @@ class ProductosMediosApp:
             )
             output += conclusion
 
+            output += texto_sensibilidad(fino, confianza)
             text_widget.delete(1.0, tk.END)
             text_widget.insert(tk.END, output)
 
@@ -1102,10 +1056,10 @@ class ProductosMediosApp:
 
             # Histograma
             n_bins = 10
-            counts, bins, patches = ax.hist(r_values, bins=n_bins, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
+            counts, bins, patches = ax.hist(r_values, bins=n_bins, weights=pesos, alpha=0.7, color='lightgreen', edgecolor='darkgreen', linewidth=1.5)
 
             # KDE
-            kde = gaussian_kde(r_values)
+            kde = gaussian_kde(r_values, weights=pesos)
             x = np.linspace(0, 1, 100)
             ax.plot(x, kde(x), color='darkorange', linewidth=2, label='Densidad Observada (KDE)')
 
@@ -1130,34 +1084,32 @@ class ProductosMediosApp:
 
         # Función para exportar a txt
         def exportar_a_txt(r_values, m, confianza):
+            resultado = self.cache_pruebas.con_intervalos(fino, r_values, m, pesos)
+            n = resultado.n
+
             # Crear contenido del archivo
             content = (
                 "Resultados de la Prueba de Uniformidad (Chi-cuadrada):\n\n"
-                f"Número de iteraciones (n): {len(r_values)}\n"
+                f"Número de iteraciones (n): {n}\n"
                 f"Número de intervalos (m): {m}\n"
-                f"Frecuencia esperada (E): {len(r_values)/m:.2f}\n\n"
+                f"Frecuencia esperada (E): {n/m:.2f}\n\n"
                 "Resultados detallados por intervalo:\n"
                 "Intervalo       Frec. Observada (Oi)   Frec. Esperada (Ei)   (Oi-Ei)^2/Ei\n"
                 "───────────────────────────────────────────────────────────────────────\n"
             )
 
-            # Contar frecuencias observadas
-            o = [0] * m
-            for r in r_values:
-                intervalo = int(r * m)
-                if intervalo == m:
-                    intervalo = m - 1
-                o[intervalo] += 1
+            o = resultado.frecuencias.tolist()
 
             for i in range(m):
                 intervalo = f"[{i*0.1:.1f}, {(i+1)*0.1:.1f})"
-                content += f"{intervalo:<15} {o[i]:<20} {len(r_values)/m:<20} {(o[i]-len(r_values)/m)**2/(len(r_values)/m):.4f}\n"
+                content += f"{intervalo:<15} {o[i]:<20} {n/m:<20} {(o[i]-n/m)**2/(n/m):.4f}\n"
 
             content += "\n"
-            chi_cuadrada_calculada = sum((oi - len(r_values)/m) ** 2 / (len(r_values)/m) for oi in o)
+            chi_cuadrada_calculada = resultado.chi_cuadrada
             content += f"Estadístico de prueba χ² calculado: {chi_cuadrada_calculada:.4f}\n"
             content += f"Grados de libertad: {m-1}\n"
             content += f"Nivel de confianza: {confianza*100}%\n"
+            content += texto_sensibilidad(fino, confianza)
 
             # Guardar en archivo
             try:
@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from cuantiles import chi2_bilateral, chi2_superior, valor_z
+from metodos_clasicos import ESTADOS, tabla_cuadrados_medios, tabla_multiplicador
+
+# Archivos del atlas (junto a este módulo)
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+RUTA_CUADRADOS = os.path.join(CARPETA, "atlas_cuadrados_medios.npy")
+RUTA_MULTIPLICADOR = os.path.join(CARPETA, "atlas_multiplicador.npy")
+
+# Parámetros por defecto de las pruebas aplicadas a cada semilla
+N_PRUEBAS = 100
+M_INTERVALOS = 10
+CONFIANZA = 0.95
+
+# Banderas del campo 'pruebas'
+PASA_MEDIAS = 1
+PASA_VARIANZA = 2
+PASA_UNIFORMIDAD = 4
+PASA_TODAS = PASA_MEDIAS | PASA_VARIANZA | PASA_UNIFORMIDAD
+
+# Un registro por semilla: longitud de cola, longitud de ciclo, estado absorbente y pruebas
+DTYPE_ATLAS = np.dtype([
+    ('cola', '<u2'),
+    ('ciclo', '<u2'),
+    ('absorbente', '<u2'),
+    ('pruebas', 'u1'),
+])
+
+
+def _estados_en_ciclo(tabla):
+    """Marca los estados que pertenecen a algún ciclo (imagen de T^(2^14), mayor que cualquier cola)."""
+    p = tabla
+    for _ in range(14):
+        p = p[p]
+    en_ciclo = np.zeros(len(tabla), dtype=bool)
+    en_ciclo[p] = True
+    return en_ciclo
+
+
+def _longitud_ciclos(tabla, en_ciclo):
+    longitud = np.zeros(len(tabla), dtype=np.int64)
+    pendientes = np.flatnonzero(en_ciclo)
+    actual = tabla[pendientes]
+    k = 1
+    while len(pendientes):
+        listo = actual == pendientes
+        longitud[pendientes[listo]] = k
+        pendientes = pendientes[~listo]
+        actual = tabla[actual[~listo]]
+        k += 1
+    return longitud
+
+
+def analizar_tabla(tabla, n=N_PRUEBAS, m=M_INTERVALOS, confianza=CONFIANZA):
+    """Analiza todas las semillas de una tabla de sucesores a la vez (vectorizado)."""
+    tabla = np.asarray(tabla, dtype=np.int64)
+    estados = len(tabla)
+    registros = np.zeros(estados, dtype=DTYPE_ATLAS)
+
+    # Cola y estado absorbente (primer estado del ciclo alcanzado)
+    en_ciclo = _estados_en_ciclo(tabla)
+    actual = np.arange(estados)
+    cola = np.zeros(estados, dtype=np.int64)
+    activos = ~en_ciclo[actual]
+    while activos.any():
+        actual[activos] = tabla[actual[activos]]
+        cola[activos] += 1
+        activos = ~en_ciclo[actual]
+    registros['cola'] = cola
+    registros['absorbente'] = actual
+    registros['ciclo'] = _longitud_ciclos(tabla, en_ciclo)[actual]
+
+    # Pruebas sobre R_1 ... R_n de cada semilla
+    filas = np.arange(estados)
+    actual = np.arange(estados)
+    suma = np.zeros(estados)
+    suma_cuadrados = np.zeros(estados)
+    conteos = np.zeros((estados, m), dtype=np.int64)
+    for _ in range(n):
+        actual = tabla[actual]
+        r = actual / 10000.0
+        suma += r
+        suma_cuadrados += r * r
+        conteos[filas, np.minimum(actual * m // 10000, m - 1)] += 1
+
+    media = suma / n
+    varianza = (suma_cuadrados - n * media ** 2) / (n - 1)
+    z = valor_z(confianza)
+    pasa_medias = np.abs(media - 0.5) <= z / np.sqrt(12 * n)
+    df = n - 1
+    chi_inferior, chi_superior = chi2_bilateral(df, confianza)
+    li_v = chi_inferior / (12 * df)
+    ls_v = chi_superior / (12 * df)
+    pasa_varianza = (li_v <= varianza) & (varianza <= ls_v)
+    e = n / m
+    chi_calculada = ((conteos - e) ** 2 / e).sum(axis=1)
+    pasa_uniformidad = chi_calculada <= chi2_superior(m - 1, confianza)
+
+    registros['pruebas'] = (pasa_medias * PASA_MEDIAS
+                            | pasa_varianza * PASA_VARIANZA
+                            | pasa_uniformidad * PASA_UNIFORMIDAD)
+    return registros
+
+
+def _ruta_metadatos(ruta):
+    return os.path.splitext(ruta)[0] + ".json"
+
+
+def _ruta_nueva(ruta):
+    # Un atlas se reconstruye aparte y luego reemplaza al anterior (os.replace): una ventana que
+    # aún tenga mapeado el archivo viejo nunca lo ve truncado ni a medio escribir
+    base, extension = os.path.splitext(ruta)
+    return base + ".nuevo" + extension
+
+
+def _guardar_metadatos(ruta, n, m, confianza, **extra):
+    destino = _ruta_nueva(_ruta_metadatos(ruta))
+    with open(destino, "w", encoding="utf-8") as archivo:
+        json.dump({"n": n, "m": m, "confianza": confianza, **extra}, archivo)
+    os.replace(destino, _ruta_metadatos(ruta))
+
+
+def _rangos(valores):
+    """Enteros agrupados en intervalos cerrados [inicio, fin] consecutivos."""
+    rangos = []
+    for v in sorted(set(valores)):
+        if rangos and v == rangos[-1][1] + 1:
+            rangos[-1][1] = v
+        else:
+            rangos.append([v, v])
+    return rangos
+
+
+def constante_en_atlas(metadatos, a):
+    """Si la fila de la constante a ya se calculó (las demás filas del archivo son ceros, no datos)."""
+    return any(inicio <= a <= fin for inicio, fin in metadatos.get("constantes", ()))
+
+
+def construir_atlas_cuadrados_medios(ruta=RUTA_CUADRADOS, n=N_PRUEBAS, m=M_INTERVALOS, confianza=CONFIANZA):
+    """Atlas de todas las semillas de 4 dígitos del método de cuadrados medios (índice = semilla)."""
+    registros = analizar_tabla(tabla_cuadrados_medios(), n, m, confianza)
+    np.save(_ruta_nueva(ruta), registros)
+    os.replace(_ruta_nueva(ruta), ruta)
+    _guardar_metadatos(ruta, n, m, confianza)
+    return registros
+
+
+def construir_atlas_multiplicador(ruta=RUTA_MULTIPLICADOR, constantes=range(1, ESTADOS),
+                                  n=N_PRUEBAS, m=M_INTERVALOS, confianza=CONFIANZA, progreso=None):
+    """Atlas de todos los pares (constante, semilla) del multiplicador constante (índice = [a, semilla]).
+
+    Se puede construir por partes (p. ej. --desde/--hasta): los metadatos guardan en 'constantes'
+    los rangos de filas ya calculados, también si el barrido se interrumpe.
+    """
+    from numpy.lib.format import open_memmap
+
+    # Las filas previas solo se conservan si se calcularon con los mismos parámetros
+    calculadas = []
+    if os.path.exists(ruta) and os.path.exists(_ruta_metadatos(ruta)):
+        with open(_ruta_metadatos(ruta), encoding="utf-8") as archivo:
+            previos = json.load(archivo)
+        if (previos["n"], previos["m"], previos["confianza"]) == (n, m, confianza):
+            calculadas = [a for inicio, fin in previos.get("constantes", ()) for a in range(inicio, fin + 1)]
+
+    # Se escribe fila por fila sobre un archivo mapeado: nunca está completo en memoria. Con
+    # filas previas se completa el mismo archivo; si no, se crea uno nuevo que lo reemplaza
+    destino = ruta if calculadas else _ruta_nueva(ruta)
+    atlas = open_memmap(destino, mode="r+" if calculadas else "w+", dtype=DTYPE_ATLAS, shape=(ESTADOS, ESTADOS))
+    try:
+        for i, a in enumerate(constantes):
+            atlas[a] = analizar_tabla(tabla_multiplicador(a), n, m, confianza)
+            calculadas.append(a)
+            tabla_multiplicador.cache_clear()
+            if progreso is not None:
+                progreso(i + 1, len(constantes))
+    finally:
+        atlas.flush()
+        del atlas
+        if destino != ruta:
+            os.replace(destino, ruta)
+        _guardar_metadatos(ruta, n, m, confianza, constantes=_rangos(calculadas))
+
+
+@lru_cache(maxsize=4)
+def _mapear_atlas(ruta, version):
+    return np.load(ruta, mmap_mode='r')
+
+
+def cargar_atlas(ruta):
+    """Abre el atlas en modo mapeado (sin leerlo completo) junto con sus parámetros.
+
+    Los metadatos (pocos bytes) se leen en cada consulta y el mapeo se renueva si el archivo
+    cambió, así que una ventana abierta ve lo que otro proceso agregue con atlas_semillas.py.
+    """
+    with open(_ruta_metadatos(ruta), encoding="utf-8") as archivo:
+        metadatos = json.load(archivo)
+    estado = os.stat(ruta)
+    return _mapear_atlas(ruta, (estado.st_ino, estado.st_mtime_ns)), metadatos
+
+
+def mejores_semillas(registros, k=5):
+    """Semillas (índices) que pasan todas las pruebas, ordenadas por cola + ciclo descendente."""
+    candidatas = np.flatnonzero(registros['pruebas'] == PASA_TODAS)
+    candidatas = candidatas[candidatas > 0]
+    largo = registros['cola'][candidatas].astype(np.int64) + registros['ciclo'][candidatas]
+    return candidatas[np.argsort(-largo, kind='stable')][:k].tolist()
+
+
+def describir_registro(registro, metadatos):
+    """Texto legible con la información del atlas para una semilla."""
+    pruebas = int(registro['pruebas'])
+    estado = lambda bandera: "pasa" if pruebas & bandera else "falla"
+    return (
+        f"Longitud de la cola: {int(registro['cola'])}\n"
+        f"Longitud del ciclo: {int(registro['ciclo'])}\n"
+        f"Estado absorbente: {int(registro['absorbente'])}\n"
+        f"Pruebas con n={metadatos['n']}, m={metadatos['m']}, confianza={metadatos['confianza']}:\n"
+        f"  Medias: {estado(PASA_MEDIAS)}\n"
+        f"  Varianza: {estado(PASA_VARIANZA)}\n"
+        f"  Uniformidad: {estado(PASA_UNIFORMIDAD)}"
+    )
+
+
+# Ejecutar el barrido completo
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construye el atlas de calidad de semillas.")
+    parser.add_argument("--n", type=int, default=N_PRUEBAS, help="Números por semilla para las pruebas")
+    parser.add_argument("--m", type=int, default=M_INTERVALOS, help="Intervalos de la prueba de uniformidad")
+    parser.add_argument("--confianza", type=float, default=CONFIANZA)
+    parser.add_argument("--desde", type=int, default=1, help="Primera constante del multiplicador")
+    parser.add_argument("--hasta", type=int, default=ESTADOS - 1, help="Última constante del multiplicador")
+    args = parser.parse_args()
+
+    construir_atlas_cuadrados_medios(n=args.n, m=args.m, confianza=args.confianza)
+    print(f"Atlas de cuadrados medios guardado en '{RUTA_CUADRADOS}'")
+
+    def mostrar_progreso(hechas, total):
+        if hechas % 100 == 0 or hechas == total:
+            print(f"Multiplicador constante: {hechas}/{total} constantes")
+
+    construir_atlas_multiplicador(constantes=range(args.desde, args.hasta + 1), n=args.n, m=args.m,
+                                  confianza=args.confianza, progreso=mostrar_progreso)
+    print(f"Atlas del multiplicador constante guardado en '{RUTA_MULTIPLICADOR}'")
@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Calculadoras que abre el menú: (módulo, clase *App)
+CALCULADORAS = [
+    ("cuadrados_medios1", "CuadradosMediosApp"),
+    ("Productos_Medios2", "ProductosMediosApp"),
+    ("Multiplicador_Constante3", "MultiplicadorConstanteApp"),
+    ("generador_uniforme", "GeneradorUniformeApp"),
+    ("prueba_kerland", "PruebaKerlandApp"),
+    ("exponencial", "ExponencialApp"),
+    ("generador_gamma", "GammaApp"),
+    ("generador_normal", "GeneradorNormalApp"),
+    ("generador_weibull", "GeneradorWeibullApp"),
+    ("generador_uniforme2", "GeneradorUniforme2App"),
+    ("generador_bernoulli", "GeneradorBernoulliApp"),
+    ("generador_binomial", "GeneradorBinomialApp"),
+    ("generador_poisson", "GeneradorPoissonApp"),
+]
+MENU = ("Menu de las calculadoras", "MenuCalculadorasApp")
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+REPETICIONES = 5
+TOLERANCIA = 0.25
+
+# Bibliotecas pesadas cuya carga al importar se considera una regresión del arranque
+PESADAS = ("numpy", "scipy", "matplotlib")
+
+
+def _memoria_residente_kb():
+    """Pico de memoria residente del proceso (None donde 'resource' no existe, p. ej. Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa en KB y macOS en bytes
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+
+def _importar(modulo):
+    if modulo == MENU[0]:
+        import importlib.util
+        ruta = os.path.join(CARPETA, modulo + ".py")
+        spec = importlib.util.spec_from_file_location("menu_calculadoras", ruta)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        return mod
+    return __import__(modulo)
+
+
+def medir(modulo, clase, memoria=False):
+    """Una medición en frío (este proceso no debe haber importado nada del proyecto).
+
+    tracemalloc hace varias veces más lenta la importación, así que los tiempos se toman
+    sin él y la memoria (memoria=True) en una ejecución aparte.
+    """
+    import tracemalloc
+    import tkinter as tk
+
+    sys.path.insert(0, CARPETA)
+    resultado = {"modulo": modulo, "clase": clase}
+    rss_inicial = _memoria_residente_kb()
+
+    if memoria:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    mod = _importar(modulo)
+    if memoria:
+        resultado["importar_memoria_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+    else:
+        resultado["importar_s"] = time.perf_counter() - t0
+    resultado["bibliotecas_cargadas"] = [b for b in PESADAS if b in sys.modules]
+
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError as e:
+        # Sin pantalla (servidor de integración continua): solo se mide la importación
+        resultado["construir_error"] = str(e)
+    else:
+        if memoria:
+            tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        # Igual que el menú: cada calculadora vive en un Toplevel; el menú, en la raíz
+        getattr(mod, clase)(root if modulo == MENU[0] else tk.Toplevel(root))
+        root.update_idletasks()
+        if memoria:
+            resultado["construir_memoria_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        else:
+            resultado["construir_s"] = time.perf_counter() - t0
+        root.destroy()
+
+    if memoria:
+        tracemalloc.stop()
+        if rss_inicial is not None:
+            resultado["memoria_residente_kb"] = _memoria_residente_kb() - rss_inicial
+    return resultado
+
+
+def _medir_en_subproceso(modulo, clase, memoria=False):
+    orden = [sys.executable, os.path.abspath(__file__), "--medir", modulo, clase]
+    salida = subprocess.run(
+        orden + (["--memoria"] if memoria else []),
+        capture_output=True, text=True, cwd=CARPETA, check=True
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def _resumir(mediciones):
+    """Mediana de cada campo numérico entre repeticiones (menos sensible a ruido que la media)."""
+    resumen = dict(mediciones[0])
+    for campo, valor in mediciones[0].items():
+        if isinstance(valor, (int, float)):
+            resumen[campo] = statistics.median(m[campo] for m in mediciones)
+    return resumen
+
+
+def ejecutar(repeticiones=REPETICIONES, calculadoras=None, progreso=None):
+    """Mide el menú y cada calculadora en procesos nuevos; devuelve el informe completo."""
+    objetivos = [MENU] + list(calculadoras or CALCULADORAS)
+    informe = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeticiones": repeticiones,
+        "modulos": {},
+    }
+    for modulo, clase in objetivos:
+        mediciones = [_medir_en_subproceso(modulo, clase) for _ in range(repeticiones)]
+        resumen = _resumir(mediciones)
+        resumen.update(_medir_en_subproceso(modulo, clase, memoria=True))
+        informe["modulos"][modulo] = resumen
+        if progreso is not None:
+            progreso(modulo, informe["modulos"][modulo])
+    return informe
+
+
+def comparar(informe, referencia, tolerancia=TOLERANCIA):
+    """Lista de regresiones frente a un informe de referencia (tiempos más lentos que 1 + tolerancia)."""
+    regresiones = []
+    for modulo, actual in informe["modulos"].items():
+        anterior = referencia.get("modulos", {}).get(modulo)
+        if anterior is None:
+            continue
+        for campo in ("importar_s", "construir_s"):
+            if campo in actual and campo in anterior and actual[campo] > anterior[campo] * (1 + tolerancia):
+                regresiones.append(f"{modulo}: {campo} {anterior[campo]:.4f} -> {actual[campo]:.4f}")
+        nuevas = set(actual["bibliotecas_cargadas"]) - set(anterior.get("bibliotecas_cargadas", []))
+        if nuevas:
+            regresiones.append(f"{modulo}: ahora importa {', '.join(sorted(nuevas))} al arrancar")
+    return regresiones
+
+
+# Ejecutar el benchmark completo
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide el arranque (importación y construcción) de cada calculadora.")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="Informe JSON de referencia para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="Fracción de tiempo extra admitida")
+    parser.add_argument("--medir", nargs=2, metavar=("MODULO", "CLASE"), help=argparse.SUPPRESS)
+    parser.add_argument("--memoria", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        # Modo interno: una medición en frío, impresa como JSON para el proceso padre
+        print(json.dumps(medir(*args.medir, memoria=args.memoria)))
+        sys.exit(0)
+
+    def mostrar_progreso(modulo, resumen):
+        construir = resumen.get("construir_s")
+        texto = f"{construir * 1000:.1f} ms" if construir is not None else "sin pantalla"
+        print(f"{modulo}: importar {resumen['importar_s'] * 1000:.1f} ms, construir {texto}")
+
+    informe = ejecutar(args.repeticiones, progreso=mostrar_progreso)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en '{args.salida}'")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            regresiones = comparar(informe, json.load(archivo), args.tolerancia)
+        for regresion in regresiones:
+            print("REGRESIÓN:", regresion)
+        sys.exit(1 if regresiones else 0)
@@ -0,0 +1,93 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from generadores import iter_bloques, iter_weibull
+from metodos_clasicos import TAMANO_BLOQUE
+from transformada_cdf import inversa_weibull
+
+# Compara el muestreo Weibull propio (transformada inversa) con scipy.stats.weibull_min.rvs:
+# tiempo de importar scipy, tiempo por tamaño de muestra y costo por llamada con bloques pequeños.
+
+TAMANOS = (10 ** 3, 10 ** 5, 10 ** 7)
+REPETICIONES = 5
+ALPHA, BETA = 2.0, 1.5
+
+
+def _mediana_tiempo(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - t0)
+    return statistics.median(tiempos)
+
+
+def importar_scipy_s():
+    """Tiempo de 'from scipy.stats import weibull_min' en un proceso nuevo (lo que ahorra la ventana)."""
+    codigo = "import time; t0 = time.perf_counter(); from scipy.stats import weibull_min; print(time.perf_counter() - t0)"
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    return float(salida.stdout.strip())
+
+
+def ejecutar(tamanos=TAMANOS, repeticiones=REPETICIONES, semilla=12345):
+    from scipy.stats import weibull_min
+
+    generador = np.random.default_rng(semilla)
+    informe = {"importar_scipy_s": importar_scipy_s(), "tamanos": {}}
+    for n in tamanos:
+        propio = _mediana_tiempo(lambda: inversa_weibull(generador.random(n), ALPHA, BETA), repeticiones)
+        scipy_s = _mediana_tiempo(lambda: weibull_min.rvs(c=ALPHA, scale=BETA, size=n, random_state=generador),
+                                  repeticiones)
+        # Bloques de TAMANO_BLOQUE como en la ventana: aquí pesa el costo fijo de cada llamada a .rvs
+        llamadas = -(-n // TAMANO_BLOQUE)
+        propio_bloques = _mediana_tiempo(
+            lambda: [inversa_weibull(generador.random(TAMANO_BLOQUE), ALPHA, BETA) for _ in range(llamadas)],
+            repeticiones)
+        scipy_bloques = _mediana_tiempo(
+            lambda: [weibull_min.rvs(c=ALPHA, scale=BETA, size=TAMANO_BLOQUE, random_state=generador)
+                     for _ in range(llamadas)],
+            repeticiones)
+        informe["tamanos"][n] = {
+            "propio_s": propio, "scipy_s": scipy_s,
+            "propio_bloques_s": propio_bloques, "scipy_bloques_s": scipy_bloques,
+        }
+
+    # Misma distribución: momentos frente a los teóricos y una muestra desde cuadrados medios
+    muestra = inversa_weibull(generador.random(10 ** 6), ALPHA, BETA)
+    referencia = weibull_min(c=ALPHA, scale=BETA)
+    clasica = np.concatenate(list(iter_weibull(iter_bloques("cuadrados_medios", 1000, semilla=1234), ALPHA, BETA)))
+    informe["validacion"] = {
+        "media": float(muestra.mean()), "media_teorica": float(referencia.mean()),
+        "varianza": float(muestra.var()), "varianza_teorica": float(referencia.var()),
+        "cuadrados_medios_finitos": bool(np.isfinite(clasica).all()),
+    }
+    return informe
+
+
+# Ejecutar la comparación
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara el muestreo Weibull propio con scipy.stats.weibull_min.")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    args = parser.parse_args()
+
+    informe = ejecutar(repeticiones=args.repeticiones)
+    print(f"Importar scipy.stats: {informe['importar_scipy_s'] * 1000:.1f} ms (el muestreo propio no lo necesita)")
+    print(f"{'n':>10} {'propio':>10} {'scipy':>10} {'x':>6} {'propio/bloques':>15} {'scipy/bloques':>14} {'x':>6}")
+    for n, t in informe["tamanos"].items():
+        print(f"{n:>10} {t['propio_s'] * 1000:>8.2f}ms {t['scipy_s'] * 1000:>8.2f}ms {t['scipy_s'] / t['propio_s']:>6.1f}"
+              f" {t['propio_bloques_s'] * 1000:>13.2f}ms {t['scipy_bloques_s'] * 1000:>12.2f}ms"
+              f" {t['scipy_bloques_s'] / t['propio_bloques_s']:>6.1f}")
+    v = informe["validacion"]
+    print(f"Media {v['media']:.5f} (teórica {v['media_teorica']:.5f}), "
+          f"varianza {v['varianza']:.5f} (teórica {v['varianza_teorica']:.5f})")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en '{args.salida}'")
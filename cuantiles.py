@@ -0,0 +1,104 @@
+import math
+from functools import lru_cache
+from statistics import NormalDist
+
+# Valores críticos de Chi-cuadrada y Z para cualquier nivel de confianza y grados de libertad,
+# sin importar scipy: la CDF de χ² es la función gamma incompleta regularizada P(df/2, x/2).
+
+_TOLERANCIA = 1e-13
+_MAX_ITERACIONES = 10_000_000
+
+
+def _gamma_inferior(a, x):
+    """P(a, x) (serie si x < a + 1, fracción continua de Lentz en otro caso)."""
+    if x <= 0:
+        return 0.0
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        termino = suma = 1.0 / a
+        ap = a
+        for _ in range(_MAX_ITERACIONES):
+            ap += 1
+            termino *= x / ap
+            suma += termino
+            if abs(termino) < abs(suma) * _TOLERANCIA:
+                break
+        return suma * math.exp(log_prefactor)
+    # Q(a, x) por fracción continua y P = 1 - Q
+    diminuto = 1e-300
+    b = x + 1 - a
+    c = 1 / diminuto
+    d = 1 / b
+    h = d
+    for i in range(1, _MAX_ITERACIONES):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = diminuto if abs(d) < diminuto else d
+        c = b + an / c
+        c = diminuto if abs(c) < diminuto else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _TOLERANCIA:
+            break
+    return 1.0 - math.exp(log_prefactor) * h
+
+
+def cdf_chi2(x, df):
+    return _gamma_inferior(df / 2, x / 2)
+
+
+def _pdf_chi2(x, df):
+    a = df / 2
+    return math.exp((a - 1) * math.log(x) - x / 2 - a * math.log(2) - math.lgamma(a))
+
+
+@lru_cache(maxsize=None)
+def cuantil_normal(p):
+    return NormalDist().inv_cdf(p)
+
+
+@lru_cache(maxsize=4096)
+def cuantil_chi2(p, df):
+    """x tal que P(χ²(df) <= x) = p (Newton acotado por bisección)."""
+    if not 0 < p < 1:
+        raise ValueError("La probabilidad debe estar entre 0 y 1.")
+    if df <= 0:
+        raise ValueError("Los grados de libertad deben ser positivos.")
+    # Punto de partida: Wilson-Hilferty, o la cola inferior P ≈ (x/2)^a / Γ(a+1) si da negativo
+    k = 2 / (9 * df)
+    x = df * (1 - k + cuantil_normal(p) * math.sqrt(k)) ** 3
+    if x <= 0:
+        a = df / 2
+        x = 2 * math.exp((math.log(p) + math.lgamma(a + 1)) / a)
+    inferior, superior = 0.0, math.inf
+    for _ in range(100):
+        error = cdf_chi2(x, df) - p
+        if error > 0:
+            superior = x
+        else:
+            inferior = x
+        siguiente = x - error / _pdf_chi2(x, df)
+        if not inferior < siguiente < superior:
+            siguiente = (inferior + superior) / 2 if superior < math.inf else 2 * x
+        if abs(siguiente - x) <= _TOLERANCIA * x:
+            return siguiente
+        x = siguiente
+    return x
+
+
+def valor_z(confianza):
+    """Z_(α/2) bilateral para el nivel de confianza dado (1.96 con 0.95)."""
+    return cuantil_normal(1 - (1 - confianza) / 2)
+
+
+def chi2_bilateral(df, confianza):
+    """(χ²(α/2, df), χ²(1-α/2, df)) con α = 1 - confianza."""
+    alpha = 1 - confianza
+    return cuantil_chi2(alpha / 2, df), cuantil_chi2(1 - alpha / 2, df)
+
+
+def chi2_superior(df, confianza):
+    """χ²(1-α, df): valor de la tabla para la prueba de uniformidad."""
+    return cuantil_chi2(confianza, df)
@@ -0,0 +1,6 @@
+# Datos fijos de k*ERLAND (calculadoras exponencial y prueba_kerland, y generadores.iter_bloques).
+# Módulo sin dependencias para que abrir esas ventanas no cargue nada más.
+DATOS_ERLANG = (
+    2.3, 14.2, 2.9, 6.1, 7.2, 5.0, 0.3, 7.1, 5.1, 1.4,
+    5.7, 3.6, 1.3, 3.3, 6.9, 5.8
+)
@@ -0,0 +1,41 @@
+import numpy as np
+
+# Generadores de NumPy por ventana en lugar del estado global np.random: cada ventana tiene
+# su propia semilla (reproducible) y de ella salen flujos hijos independientes y sin solapamiento
+# (SeedSequence.spawn) para repartir una generación entre hilos o procesos.
+
+
+def leer_semilla(texto):
+    """Semilla escrita por el usuario; vacía = entropía del sistema (None)."""
+    texto = str(texto).strip()
+    if not texto:
+        return None
+    semilla = int(texto)
+    if semilla < 0:
+        raise ValueError("La semilla debe ser un entero no negativo.")
+    return semilla
+
+
+class FlujoAleatorio:
+    """numpy.random.Generator (PCG64) con su SeedSequence, de la que se derivan flujos hijos."""
+
+    def __init__(self, semilla=None):
+        # semilla puede ser un entero, None o una SeedSequence ya derivada (flujo hijo)
+        if isinstance(semilla, np.random.SeedSequence):
+            self.secuencia = semilla
+        else:
+            self.secuencia = np.random.SeedSequence(semilla)
+        self.generador = np.random.default_rng(self.secuencia)
+
+    @property
+    def semilla(self):
+        """Entropía de la raíz: con ella se repite exactamente la misma sucesión."""
+        return self.secuencia.entropy
+
+    def secuencias_hijas(self, k):
+        """k SeedSequence independientes (se pueden enviar a otros procesos)."""
+        return self.secuencia.spawn(k)
+
+    def hijos(self, k):
+        """k flujos independientes; llamadas sucesivas nunca repiten un hijo anterior."""
+        return [FlujoAleatorio(secuencia) for secuencia in self.secuencias_hijas(k)]
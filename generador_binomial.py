@@ -1,9 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import gaussian_kde
+from tabla_virtual import TablaVirtual
+from segundo_plano import TareaEnSegundoPlano
+from flujos_aleatorios import FlujoAleatorio, leer_semilla
+from muestreo_paralelo import bloques_muestra
+from pruebas_estadisticas import CacheResultados, chi_varianza, chi_uniformidad, texto_sensibilidad, M_FINO
 
 class GeneradorBinomialApp:
     def __init__(self, root):
@@ -26,6 +28,11 @@ class GeneradorBinomialApp:
         # Variables
         self.p_var = tk.StringVar()
         self.n_var = tk.StringVar()
+        self.semilla_var = tk.StringVar()  # Vacía = entropía del sistema (muestra nueva cada vez)
+        self.semilla_usada_var = tk.StringVar()
+
+        # Resultados de las pruebas ya calculados para los datos actuales
+        self.cache_pruebas = CacheResultados()
 
         # Crear widgets
         self.create_widgets()
@@ -77,6 +84,30 @@ class GeneradorBinomialApp:
             bd=2
         ).grid(row=1, column=1, padx=10, pady=5)
 
+        tk.Label(
+            input_frame,
+            text="Semilla (opcional):",
+            font=("Arial", 11),
+            bg="#E3F2FD",
+            fg="#000102"
+        ).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        tk.Entry(
+            input_frame,
+            textvariable=self.semilla_var,
+            width=20,
+            font=("Arial", 10),
+            relief="solid",
+            bd=2
+        ).grid(row=2, column=1, padx=10, pady=5)
+        # Semilla con la que se generó la última muestra (para repetirla escribiéndola arriba)
+        tk.Label(
+            input_frame,
+            textvariable=self.semilla_usada_var,
+            font=("Arial", 9),
+            bg="#E3F2FD",
+            fg="#000102"
+        ).grid(row=3, column=0, columnspan=2, sticky="w", padx=10)
+
         # Botones inferiores
         button_frame = tk.Frame(self.root, bg="#E3F2FD")
         button_frame.pack(pady=10)
@@ -98,9 +129,20 @@ class GeneradorBinomialApp:
             command=self.root.quit,
             style="TButton"
         ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame,
+            text="⛔ Cancelar",
+            command=self.cancelar_generacion,
+            style="TButton"
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Progreso de la generación en segundo plano
+        self.barra_progreso = ttk.Progressbar(button_frame, length=150, mode="determinate")
+        self.barra_progreso.pack(side=tk.LEFT, padx=5)
+        self.tarea = TareaEnSegundoPlano(self.root, self.barra_progreso)
 
         # Tabla con Treeview
-        self.tree = ttk.Treeview(
+        self.tree = TablaVirtual(
             self.root,
             columns=("NRO", "BINOMIAL"),
             show="headings",
@@ -142,52 +184,62 @@ class GeneradorBinomialApp:
         try:
             p = float(self.p_var.get())
             n_ensayos = int(self.n_var.get())
+            semilla = leer_semilla(self.semilla_var.get())
 
             if p < 0 or p > 1:
                 raise ValueError("La probabilidad debe estar entre 0 y 1.")
             if n_ensayos <= 0:
                 raise ValueError("El número de ensayos debe ser positivo.")
 
-            # Limpiar tabla
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            self.limpiar_tabla()
+
+            # Generator propio de la ventana; sin semilla cada clic da una muestra nueva y la
+            # entropía usada solo se informa, sin escribirla en el campo
+            self.flujo = FlujoAleatorio(semilla)
+            self.semilla_usada_var.set(f"Semilla usada: {self.flujo.semilla}")
+
+            def mostrar(valores):
+                # Cargar en la tabla virtual (solo se dibujan las filas visibles)
+                self.tree.cargar(range(1, len(valores) + 1), valores, reiniciar=False)
 
-            # Generar números aleatorios Binomial
-            valores = np.random.binomial(n=n_ensayos, p=p, size=n_ensayos)
+            def terminar(valores, cancelada):
+                mostrar(valores)
+                # El arreglo es la fuente de verdad de las pruebas, histogramas y exportaciones
+                self.valores = valores
+                # Las pruebas usan los parámetros de esta muestra, no lo que tengan después los campos
+                self.parametros = n_ensayos
 
-            # Insertar en la tabla
-            for i, val in enumerate(valores):
-                self.tree.insert("", tk.END, values=(
-                    i + 1,
-                    val
-                ))
+            # Generar números aleatorios Binomial en segundo plano, por bloques o en paralelo si n es muy grande
+            self.tarea.iniciar(bloques_muestra("binomial", {"n": n_ensayos, "p": p}, n_ensayos, self.flujo),
+                               n_ensayos, al_avanzar=mostrar, al_terminar=terminar)
 
         except ValueError as e:
             messagebox.showerror("Error", f"Entrada inválida: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error: {e}")
 
+    def cancelar_generacion(self):
+        self.tarea.cancelar()
+
     def limpiar_tabla(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tarea.cancelar()
+        self.tree.limpiar()
+        self.cache_pruebas.limpiar()
+        if hasattr(self, 'valores'):
+            del self.valores
 
     def _get_r_values(self):
         """Convierte los valores Binomial a U[0,1] usando la transformación lineal."""
-        items = self.tree.get_children()
-        if not items:
+        if not hasattr(self, 'valores') or len(self.valores) == 0:
             return []
-        r_vals = []
-        for item in items:
-            x_str = self.tree.item(item, 'values')[1]
-            x = int(x_str)
-            # Para Binomial, normalizamos dividiendo por el número máximo posible (n_ensayos)
-            r_vals.append(float(x) / float(self.n_var.get()))
-        return r_vals
+        # Para Binomial, normalizamos dividiendo por el número máximo posible (n_ensayos)
+        n_ensayos = float(self.parametros)
+        return self.cache_pruebas.muestra(("lineal", n_ensayos), lambda: self.valores / n_ensayos)
 
     # === PRUEBA DE MEDIAS ===
     def prueba_medias(self):
         r_values = self._get_r_values()
-        if not r_values:
+        if len(r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
@@ -241,12 +293,9 @@ class GeneradorBinomialApp:
         result_text.pack(pady=10, padx=20)
 
         def ejecutar_prueba():
-            n = len(r_values)
-            media_calculado = sum(r_values) / n
-            error_estandar = 1 / math.sqrt(12 * n)
-            li_r = 0.5 - z_var.get() * error_estandar
-            ls_r = 0.5 + z_var.get() * error_estandar
-            aceptado = li_r <= media_calculado <= ls_r
+            resultado = self.cache_pruebas.evaluar(r_values)
+            n, media_calculado = resultado.n, resultado.media
+            li_r, ls_r, aceptado = resultado.prueba_medias(z_var.get())
             output = (
                 "Resultados de la Prueba de Medias:\n"
                 f"Número de iteraciones (n): {n}\n"
@@ -274,7 +323,7 @@ class GeneradorBinomialApp:
     # === PRUEBA DE VARIANZA ===
     def prueba_varianza(self):
         r_values = self._get_r_values()
-        if not r_values:
+        if len(r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
@@ -325,33 +374,15 @@ class GeneradorBinomialApp:
         result_text.pack(pady=10, padx=20)
 
         def ejecutar_prueba():
-            n = len(r_values)
-            media = sum(r_values) / n
-            varianza_muestra = sum((x - media) ** 2 for x in r_values) / (n - 1)
+            resultado = self.cache_pruebas.evaluar(r_values)
+            n = resultado.n
             df = n - 1
-            chi_tabla = {
-                1: (0.000157, 3.8415), 2: (0.010025, 5.9915), 3: (0.071721, 7.8147), 4: (0.20700, 9.4877),
-                5: (0.41174, 11.0705), 6: (0.67573, 12.5916), 7: (0.98926, 14.0671), 8: (1.3444, 15.5073),
-                9: (1.7349, 16.9190), 10: (2.1559, 18.3070), 11: (2.6032, 19.6752), 12: (3.0738, 21.0261),
-                13: (3.5650, 22.3620), 14: (4.0747, 23.6848), 15: (4.6009, 24.9958), 16: (5.1422, 26.2962),
-                17: (5.6972, 27.5871), 18: (6.2621, 28.8693), 19: (6.8351, 30.1435), 20: (7.4140, 31.4104),
-                21: (7.9962, 32.6706), 22: (8.5834, 33.9245), 23: (9.1745, 35.1725), 24: (9.7684, 36.4150),
-                25: (10.365, 37.6525), 26: (10.965, 38.8851), 27: (11.568, 40.1133), 28: (12.173, 41.3372),
-                29: (12.781, 42.5569), 30: (13.392, 43.7730)
-            }
             if modo_var.get() == "automático":
-                if df in chi_tabla:
-                    chi_alpha_2 = chi_tabla[df][0]
-                    chi_1_minus_alpha_2 = chi_tabla[df][1]
-                else:
-                    chi_alpha_2 = 0.0
-                    chi_1_minus_alpha_2 = float('inf')
+                chi_alpha_2, chi_1_minus_alpha_2 = chi_varianza(df, confianza_var.get())
             else:
                 chi_alpha_2 = chi_alpha_2_var.get()
                 chi_1_minus_alpha_2 = chi_1_minus_alpha_2_var.get()
-            li_v = chi_alpha_2 / (12 * df)
-            ls_v = chi_1_minus_alpha_2 / (12 * df)
-            aceptado = li_v <= varianza_muestra <= ls_v
+            li_v, ls_v, aceptado = resultado.prueba_varianza(chi_alpha_2, chi_1_minus_alpha_2)
             output = (
                 f"Resultados de la Prueba de Varianza (Modo {modo_var.get().capitalize()}):\n"
                 f"Número de iteraciones (n): {n}\n"
@@ -382,10 +413,13 @@ class GeneradorBinomialApp:
     # === PRUEBA DE UNIFORMIDAD ===
     def prueba_uniformidad(self):
         r_values = self._get_r_values()
-        if not r_values:
+        if len(r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero genera los números.")
             return
 
+        # Histograma fino: cualquier m que lo divida se agrupa sin volver a recorrer los datos
+        fino = self.cache_pruebas.evaluar(r_values, M_FINO)
+
         ventana_prueba = tk.Toplevel(self.root)
         ventana_prueba.title("Prueba de Uniformidad")
         ventana_prueba.geometry("600x700")
@@ -420,16 +454,12 @@ class GeneradorBinomialApp:
                 result_text.insert(tk.END, f"Error: Necesitas al menos {m} valores para {m} intervalos.")
                 return
             e = n / m
-            o = [0] * m
-            for r in r_values:
-                idx = int(r * m)
-                if idx == m: idx = m - 1
-                o[idx] += 1
-            chi_cuadrada_calculada = sum((oi - e) ** 2 / e for oi in o)
+            # Frecuencias observadas agrupando el histograma fino
+            resultado = self.cache_pruebas.con_intervalos(fino, r_values, m)
+            o = resultado.frecuencias
             df = m - 1
-            chi_tabla = {1: 3.8415, 2: 5.9915, 3: 7.8147, 4: 9.4877, 5: 11.0705, 6: 12.5916, 7: 14.0671, 8: 15.5073, 9: 16.9190, 10: 18.3070}
-            chi_tabla_valor = chi_tabla.get(df, float('inf'))
-            aceptado = chi_cuadrada_calculada <= chi_tabla_valor
+            chi_tabla_valor = chi_uniformidad(df, confianza_var.get())
+            chi_cuadrada_calculada, aceptado = resultado.prueba_uniformidad(chi_tabla_valor)
             output = (
                 "Resultados de la Prueba de Uniformidad (Chi-cuadrada):\n"
                 f"Número de valores (n): {n}\n"
@@ -446,6 +476,7 @@ class GeneradorBinomialApp:
             output += f"Grados de libertad: {df}\n"
             output += f"Valor de χ² de la tabla: {chi_tabla_valor:.4f}\n"
             output += ("ACEPTADO" if aceptado else "RECHAZADO")
+            output += texto_sensibilidad(fino, confianza_var.get())
             result_text.delete(1.0, tk.END)
             result_text.insert(tk.END, output)
 
@@ -457,6 +488,10 @@ class GeneradorBinomialApp:
         ttk.Button(btn_frame, text="Volver", command=ventana_prueba.destroy, style="TButton").pack(side=tk.LEFT, padx=5)
 
     def mostrar_histograma(self, r_values):
+        # matplotlib y scipy solo se cargan cuando se pide un histograma
+        import matplotlib.pyplot as plt
+        from scipy.stats import gaussian_kde
+
         fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
         fig.patch.set_facecolor('#ffffff')
         ax.set_facecolor('#ffffff')
@@ -475,12 +510,9 @@ class GeneradorBinomialApp:
         plt.show()
 
     def exportar_medias(self, r_values, z_value):
-        n = len(r_values)
-        media = sum(r_values) / n
-        error_estandar = 1 / math.sqrt(12 * n)
-        li_r = 0.5 - z_value * error_estandar
-        ls_r = 0.5 + z_value * error_estandar
-        aceptado = li_r <= media <= ls_r
+        resultado = self.cache_pruebas.evaluar(r_values)
+        n, media = resultado.n, resultado.media
+        li_r, ls_r, aceptado = resultado.prueba_medias(z_value)
         output = (
             "Resultados de la Prueba de Medias:\n"
             f"Número de valores (n): {n}\n"
@@ -497,33 +529,15 @@ class GeneradorBinomialApp:
             messagebox.showerror("Error", f"No se pudo guardar: {str(e)}")
 
     def exportar_varianza(self, r_values, modo, confianza, chi_alpha_2_manual, chi_1_minus_alpha_2_manual):
-        n = len(r_values)
-        media = sum(r_values) / n
-        varianza_muestra = sum((x - media) ** 2 for x in r_values) / (n - 1)
+        resultado = self.cache_pruebas.evaluar(r_values)
+        n = resultado.n
         df = n - 1
-        chi_tabla = {
-            1: (0.000157, 3.8415), 2: (0.010025, 5.9915), 3: (0.071721, 7.8147), 4: (0.20700, 9.4877),
-            5: (0.41174, 11.0705), 6: (0.67573, 12.5916), 7: (0.98926, 14.0671), 8: (1.3444, 15.5073),
-            9: (1.7349, 16.9190), 10: (2.1559, 18.3070), 11: (2.6032, 19.6752), 12: (3.0738, 21.0261),
-            13: (3.5650, 22.3620), 14: (4.0747, 23.6848), 15: (4.6009, 24.9958), 16: (5.1422, 26.2962),
-            17: (5.6972, 27.5871), 18: (6.2621, 28.8693), 19: (6.8351, 30.1435), 20: (7.4140, 31.4104),
-            21: (7.9962, 32.6706), 22: (8.5834, 33.9245), 23: (9.1745, 35.1725), 24: (9.7684, 36.4150),
-            25: (10.365, 37.6525), 26: (10.965, 38.8851), 27: (11.568, 40.1133), 28: (12.173, 41.3372),
-            29: (12.781, 42.5569), 30: (13.392, 43.7730)
-        }
         if modo == "automático":
-            if df in chi_tabla:
-                chi_alpha_2 = chi_tabla[df][0]
-                chi_1_minus_alpha_2 = chi_tabla[df][1]
-            else:
-                chi_alpha_2 = 0.0
-                chi_1_minus_alpha_2 = float('inf')
+            chi_alpha_2, chi_1_minus_alpha_2 = chi_varianza(df, confianza)
         else:
             chi_alpha_2 = chi_alpha_2_manual
             chi_1_minus_alpha_2 = chi_1_minus_alpha_2_manual
-        li_v = chi_alpha_2 / (12 * df)
-        ls_v = chi_1_minus_alpha_2 / (12 * df)
-        aceptado = li_v <= varianza_muestra <= ls_v
+        li_v, ls_v, aceptado = resultado.prueba_varianza(chi_alpha_2, chi_1_minus_alpha_2)
         output = (
             f"Resultados de la Prueba de Varianza (Modo {modo.capitalize()}):\n"
             f"Número de iteraciones (n): {n}\n"
@@ -543,16 +557,13 @@ class GeneradorBinomialApp:
     def exportar_uniformidad(self, r_values, m, confianza):
         n = len(r_values)
         e = n / m
-        o = [0] * m
-        for r in r_values:
-            idx = int(r * m)
-            if idx == m: idx = m - 1
-            o[idx] += 1
-        chi_cuadrada_calculada = sum((oi - e) ** 2 / e for oi in o)
+        # Frecuencias observadas agrupando el histograma fino
+        fino = self.cache_pruebas.evaluar(r_values, M_FINO)
+        resultado = self.cache_pruebas.con_intervalos(fino, r_values, m)
+        o = resultado.frecuencias
         df = m - 1
-        chi_tabla = {1: 3.8415, 2: 5.9915, 3: 7.8147, 4: 9.4877, 5: 11.0705, 6: 12.5916, 7: 14.0671, 8: 15.5073, 9: 16.9190, 10: 18.3070}
-        chi_tabla_valor = chi_tabla.get(df, float('inf'))
-        aceptado = chi_cuadrada_calculada <= chi_tabla_valor
+        chi_tabla_valor = chi_uniformidad(df, confianza)
+        chi_cuadrada_calculada, aceptado = resultado.prueba_uniformidad(chi_tabla_valor)
         output = (
             "Resultados de la Prueba de Uniformidad (Chi-cuadrada):\n"
             f"Número de valores (n): {n}\n"
@@ -569,6 +580,7 @@ class GeneradorBinomialApp:
         output += f"Grados de libertad: {df}\n"
         output += f"Valor de χ² de la tabla: {chi_tabla_valor:.4f}\n"
         output += ("ACEPTADO" if aceptado else "RECHAZADO")
+        output += texto_sensibilidad(fino, confianza)
         try:
             with open("prueba_uniformidad_binomial.txt", "w") as f:
                 f.write(output)
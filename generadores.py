@@ -0,0 +1,91 @@
+import numpy as np
+
+from flujos_aleatorios import FlujoAleatorio
+from metodos_clasicos import (TAMANO_BLOQUE, DIGITOS, iter_cuadrados_medios, iter_productos_medios,
+                              iter_multiplicador_constante)
+from muestreo_paralelo import muestra
+from transformada_cdf import inversa_weibull
+from datos import DATOS_ERLANG
+
+# Los 13 métodos de las calculadoras como generadores por bloques, sin Tk: cada bloque tiene a lo
+# más tamano_bloque valores, así que las pruebas (evaluar_bloques), exportaciones y gráficas
+# pueden recorrer sucesiones mucho más grandes que la memoria.
+
+
+def _solo_r(bloques):
+    """De los bloques (X_i, R_i) de los métodos clásicos deja solo R_i."""
+    for _, r in bloques:
+        yield r
+
+
+def _cuadrados_medios(n, tamano_bloque, semilla, inicio=0, digitos=DIGITOS):
+    return _solo_r(iter_cuadrados_medios(semilla, n, tamano_bloque, inicio=inicio, digitos=digitos))
+
+
+def _productos_medios(n, tamano_bloque, semilla1, semilla2, inicio=0, digitos=DIGITOS):
+    return _solo_r(iter_productos_medios(semilla1, semilla2, n, tamano_bloque, inicio=inicio, digitos=digitos))
+
+
+def _multiplicador_constante(n, tamano_bloque, a, semilla, inicio=0, digitos=DIGITOS):
+    return _solo_r(iter_multiplicador_constante(a, semilla, n, tamano_bloque, inicio=inicio, digitos=digitos))
+
+
+def _datos_erlang(n, tamano_bloque):
+    if n > len(DATOS_ERLANG):
+        raise ValueError(f"Los datos fijos de k*ERLAND solo tienen {len(DATOS_ERLANG)} valores.")
+    for a in range(0, n, tamano_bloque):
+        yield np.array(DATOS_ERLANG[a:min(a + tamano_bloque, n)], dtype=float)
+
+
+def _distribucion(distribucion, convertir):
+    """Método de una distribución: convertir(**parametros) da los argumentos de muestra()."""
+
+    def bloques(n, tamano_bloque, semilla=None, **parametros):
+        generador = FlujoAleatorio(semilla).generador
+        argumentos = convertir(**parametros)
+        for a in range(0, n, tamano_bloque):
+            yield muestra(generador, distribucion, argumentos, min(tamano_bloque, n - a))
+
+    return bloques
+
+
+METODOS = {
+    "cuadrados_medios": _cuadrados_medios,
+    "productos_medios": _productos_medios,
+    "multiplicador_constante": _multiplicador_constante,
+    "uniforme": _distribucion("uniform", lambda a, b: {"low": a, "high": b}),
+    "kerland": _datos_erlang,
+    "exponencial": _datos_erlang,
+    "gamma": _distribucion("gamma", lambda alpha, beta: {"shape": alpha, "scale": beta}),
+    "normal": _distribucion("normal", lambda mu, sigma: {"loc": mu, "scale": sigma}),
+    "weibull": _distribucion("weibull", lambda alpha, beta: {"alpha": alpha, "beta": beta}),
+    "uniforme2": _distribucion("uniform", lambda minimo, maximo: {"low": minimo, "high": maximo}),
+    "bernoulli": _distribucion("binomial", lambda p: {"n": 1, "p": p}),
+    "binomial": _distribucion("binomial", lambda ensayos, p: {"n": ensayos, "p": p}),
+    "poisson": _distribucion("poisson", lambda lam: {"lam": lam}),
+}
+
+
+def iter_weibull(uniformes, alpha, beta):
+    """Weibull(alpha, beta) por transformada inversa sobre cualquier flujo de bloques U[0,1).
+
+    Por ejemplo, iter_weibull(iter_bloques("cuadrados_medios", n, semilla=1234), 2, 1) usa los
+    R_i de cuadrados medios; los bloques (x, r) de metodos_clasicos también sirven.
+    """
+    for u in uniformes:
+        yield inversa_weibull(u[-1] if isinstance(u, tuple) else u, alpha, beta)
+
+
+def iter_bloques(metodo, n, tamano_bloque=TAMANO_BLOQUE, **parametros):
+    """Genera n valores del método en bloques de a lo más tamano_bloque.
+
+    Los métodos clásicos entregan R_i; las distribuciones, sus valores (con semilla=... son
+    reproducibles); kerland y exponencial, sus datos fijos. Por ejemplo:
+    evaluar_bloques(iter_bloques("gamma", 10**10, alpha=2, beta=1, semilla=7), m).
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}. Opciones: {', '.join(METODOS)}.")
+    n, tamano_bloque = int(n), int(tamano_bloque)
+    if n < 0 or tamano_bloque <= 0:
+        raise ValueError("n no puede ser negativo y el tamaño de bloque debe ser positivo.")
+    return METODOS[metodo](n, tamano_bloque, **parametros)
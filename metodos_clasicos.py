@@ -0,0 +1,705 @@
+import threading
+from functools import lru_cache, partial
+
+import numpy as np
+
+# Tamaño de bloque por defecto para la generación por partes
+TAMANO_BLOQUE = 65536
+
+# Número de dígitos centrales por defecto y estados posibles con 4 dígitos
+DIGITOS = 4
+ESTADOS = 10000
+
+# Potencias de 10 que caben en int64 (10^1 ... 10^18)
+_POTENCIAS = 10 ** np.arange(1, 19, dtype=np.int64)
+
+# Mayor factor cuyo producto consigo mismo cabe en int64
+_LIMITE_INT64 = 3037000499
+
+
+def num_digitos(valor):
+    """Cuenta los dígitos decimales de un entero no negativo sin convertirlo a str."""
+    if valor == 0:
+        return 1
+    # log10(2) ≈ 1233 / 4096, se corrige con una sola comparación
+    t = (valor.bit_length() * 1233) >> 12
+    return t + 1 if valor >= 10 ** t else t
+
+
+def digitos_centrales(valor, longitud, digitos=DIGITOS):
+    """Devuelve los 'digitos' centrales de 'valor' escrito con 'longitud' cifras (con ceros a la izquierda)."""
+    medio = longitud // 2
+    mitad = digitos // 2
+    if medio < mitad:
+        # Igual que el corte str[medio-mitad:medio+mitad] con inicio negativo (p. ej. "09"[-1:3] → "9")
+        inicio = max(medio - mitad + longitud, 0)
+        return valor % 10 ** (longitud - inicio)
+    return (valor // 10 ** (longitud - medio - mitad)) % 10 ** digitos
+
+
+def validar_digitos(digitos):
+    """Comprueba que D sea un número par de dígitos centrales."""
+    digitos = int(digitos)
+    if digitos < 2 or digitos % 2:
+        raise ValueError("El número de dígitos centrales (D) debe ser par y mayor o igual a 2.")
+    return digitos
+
+
+def cabe_en_int64(digitos, factor=None):
+    """Indica si el producto de dos estados de D dígitos (o factor × estado) cabe en int64."""
+    maximo = 10 ** digitos - 1
+    return (maximo if factor is None else int(factor)) * maximo < 2 ** 63
+
+
+def num_digitos_arr(valores):
+    """Versión vectorizada de num_digitos para arreglos int64 no negativos."""
+    return np.searchsorted(_POTENCIAS, valores, side='right') + 1
+
+
+def digitos_centrales_arr(valores, longitudes, digitos=DIGITOS):
+    """Versión vectorizada de digitos_centrales para arreglos int64."""
+    medio = longitudes // 2
+    mitad = digitos // 2
+    corrimiento = np.maximum(longitudes - medio - mitad, 0)
+    centro = (valores // 10 ** corrimiento) % 10 ** digitos
+    inicio = np.maximum(medio - mitad + longitudes, 0)
+    extremo = valores % 10 ** np.clip(longitudes - inicio, 0, 18)
+    return np.where(medio < mitad, extremo, centro)
+
+
+def paso_cuadrado_medio(y, digitos=DIGITOS):
+    """Un paso del método de cuadrados medios: devuelve (cuadrado, x)."""
+    cuadrado = y * y
+    longitud = num_digitos(cuadrado)
+    # Regla: si longitud impar → agregar cero adelante
+    if longitud % 2 == 1:
+        longitud += 1
+    return cuadrado, digitos_centrales(cuadrado, longitud, digitos)
+
+
+def paso_productos_medios(y_prev, y_curr, digitos=DIGITOS):
+    """Un paso del método de productos medios: devuelve (producto, x)."""
+    producto = y_prev * y_curr
+    longitud = num_digitos(producto)
+    # Regla: si longitud impar → agregar cero adelante
+    if longitud % 2 == 1:
+        longitud += 1
+    return producto, digitos_centrales(producto, longitud, digitos)
+
+
+def paso_multiplicador(a, y, digitos=DIGITOS):
+    """Un paso del método del multiplicador constante: devuelve (producto, x)."""
+    producto = a * y
+    # Regla: asegurar que tenga al menos 2D dígitos (8 con D = 4)
+    longitud = max(num_digitos(producto), 2 * digitos)
+    return producto, digitos_centrales(producto, longitud, digitos)
+
+
+def paso_cuadrado_medio_arr(y, digitos=DIGITOS):
+    """Paso vectorizado de cuadrados medios para un arreglo int64 de estados (división y módulo)."""
+    cuadrado = y * y
+    longitud = num_digitos_arr(cuadrado)
+    longitud += longitud % 2
+    return digitos_centrales_arr(cuadrado, longitud, digitos)
+
+
+def paso_productos_medios_arr(y_prev, y_curr, digitos=DIGITOS):
+    """Paso vectorizado de productos medios para arreglos int64 de pares de estados."""
+    producto = y_prev * y_curr
+    longitud = num_digitos_arr(producto)
+    longitud += longitud % 2
+    return digitos_centrales_arr(producto, longitud, digitos)
+
+
+def paso_multiplicador_arr(a, y, digitos=DIGITOS):
+    """Paso vectorizado del multiplicador constante ('a' escalar o arreglo)."""
+    producto = a * y
+    longitud = np.maximum(num_digitos_arr(producto), 2 * digitos)
+    return digitos_centrales_arr(producto, longitud, digitos)
+
+
+def _centrales_int64(digitos, minima=None):
+    """digitos_centrales de un producto que cabe en int64, con las potencias de 10 precalculadas.
+
+    Sin 'minima' aplica la regla de cuadrados y productos (longitud par); con minima = 2D, la
+    del multiplicador. Un valor mayor (p. ej. con una semilla de más de D dígitos) usa la vía general.
+    """
+    potencias = [10 ** i for i in range(20)]
+    modulo, mitad = 10 ** digitos, digitos // 2
+
+    def centro(valor):
+        if valor >= 2 ** 63:
+            longitud = num_digitos(valor)
+            longitud = max(longitud, minima) if minima else longitud + longitud % 2
+            return digitos_centrales(valor, longitud, digitos)
+        t = (valor.bit_length() * 1233) >> 12
+        longitud = t + 1 if valor >= potencias[t] else max(t, 1)
+        longitud = max(longitud, minima) if minima else longitud + (longitud & 1)
+        medio = longitud // 2
+        if medio < mitad:
+            return valor % potencias[longitud - max(medio - mitad + longitud, 0)]
+        return (valor // potencias[longitud - medio - mitad]) % modulo
+
+    return centro
+
+
+@lru_cache(maxsize=None)
+def tabla_cuadrados_medios():
+    """Tabla de sucesores (uint16) de los 10,000 estados de 4 dígitos; se calcula una sola vez."""
+    y = np.arange(ESTADOS, dtype=np.int64)
+    tabla = paso_cuadrado_medio_arr(y).astype(np.uint16)
+    tabla.setflags(write=False)
+    return tabla
+
+
+@lru_cache(maxsize=64)
+def tabla_multiplicador(a):
+    """Tabla de sucesores (uint16) del multiplicador constante 'a' sobre los 10,000 estados."""
+    if a * (ESTADOS - 1) < 2 ** 63:
+        y = np.arange(ESTADOS, dtype=np.int64)
+        tabla = paso_multiplicador_arr(a, y).astype(np.uint16)
+    else:
+        # Constantes enormes: el producto no cabe en int64
+        tabla = np.array([paso_multiplicador(a, y)[1] for y in range(ESTADOS)], dtype=np.uint16)
+    tabla.setflags(write=False)
+    return tabla
+
+
+class SaltoBinario:
+    """Tablas de duplicación T^(2^j) sobre un espacio finito de estados para saltar k pasos en O(log k)."""
+
+    def __init__(self, tabla):
+        self.niveles = [np.asarray(tabla)]
+        # La instancia se comparte (lru_cache) entre los hilos trabajadores de varias ventanas
+        self._candado = threading.Lock()
+
+    def nivel(self, j):
+        if j < len(self.niveles):
+            return self.niveles[j]
+        # Los niveles se construyen bajo demanda: T^(2^(j+1)) = T^(2^j) ∘ T^(2^j)
+        with self._candado:
+            while len(self.niveles) <= j:
+                t = self.niveles[-1]
+                self.niveles.append(t[t])
+            return self.niveles[j]
+
+    def saltar(self, estado, k):
+        j = 0
+        while k:
+            if k & 1:
+                estado = self.nivel(j)[estado]
+            k >>= 1
+            j += 1
+        return estado
+
+
+@lru_cache(maxsize=None)
+def saltos_cuadrados_medios():
+    return SaltoBinario(tabla_cuadrados_medios())
+
+
+@lru_cache(maxsize=64)
+def saltos_multiplicador(a):
+    return SaltoBinario(tabla_multiplicador(a))
+
+
+def _validar_salto(k):
+    k = int(k)
+    if k < 0:
+        raise ValueError("El número de pasos a saltar no puede ser negativo.")
+    return k
+
+
+def _caminar(y, k, siguiente):
+    for _ in range(k):
+        y = siguiente(y)
+    return y
+
+
+def _brent(x0, siguiente):
+    """Algoritmo de Brent: (mu, lam) de la sucesión x0, f(x0), ... con memoria O(1)."""
+    potencia = lam = 1
+    tortuga, liebre = x0, siguiente(x0)
+    while tortuga != liebre:
+        if potencia == lam:
+            tortuga = liebre
+            potencia *= 2
+            lam = 0
+        liebre = siguiente(liebre)
+        lam += 1
+    return _cola(x0, lam, siguiente), lam
+
+
+def _cola(x0, lam, siguiente):
+    """Longitud de la cola (mu) conocido el periodo lam."""
+    tortuga, liebre = x0, _caminar(x0, lam, siguiente)
+    mu = 0
+    while tortuga != liebre:
+        tortuga, liebre = siguiente(tortuga), siguiente(liebre)
+        mu += 1
+    return mu
+
+
+def _avanzar(x0, k, siguiente):
+    """f^k(x0) sin recorrer más de lo necesario: k pasos si el ciclo no se cierra antes; si se
+    cierra, Brent da (mu, lam) y k se reduce módulo lam (O(cola + periodo) aunque k sea enorme)."""
+    if k == 0:
+        return x0
+    potencia = lam = pasos = 1
+    tortuga, liebre = x0, siguiente(x0)
+    while tortuga != liebre:
+        if pasos == k:
+            return liebre
+        if potencia == lam:
+            tortuga = liebre
+            potencia *= 2
+            lam = 0
+        liebre = siguiente(liebre)
+        lam += 1
+        pasos += 1
+    mu = _cola(x0, lam, siguiente)
+    return _caminar(x0, k if k < mu else mu + (k - mu) % lam, siguiente)
+
+
+def estado_cuadrados_medios(semilla, k, digitos=DIGITOS):
+    """Estado Y_k del método de cuadrados medios (Y_0 = semilla); en O(log k) con D = 4 y O(min(k, cola + periodo)) con otro D."""
+    k = _validar_salto(k)
+    if k == 0:
+        return int(semilla)
+    y = paso_cuadrado_medio(int(semilla), digitos)[1]
+    if digitos != DIGITOS:
+        # Sin tabla de sucesores (10^D estados): paso a paso, a lo más cola + periodo
+        return _avanzar(y, k - 1, lambda v: paso_cuadrado_medio(v, digitos)[1])
+    return int(saltos_cuadrados_medios().saltar(y, k - 1))
+
+
+def estado_multiplicador(a, semilla, k, digitos=DIGITOS):
+    """Estado Y_k del multiplicador constante (Y_0 = semilla); en O(log k) con D = 4 y O(min(k, cola + periodo)) con otro D."""
+    k = _validar_salto(k)
+    if k == 0:
+        return int(semilla)
+    a = int(a)
+    y = paso_multiplicador(a, int(semilla), digitos)[1]
+    if digitos != DIGITOS:
+        return _avanzar(y, k - 1, lambda v: paso_multiplicador(a, v, digitos)[1])
+    return int(saltos_multiplicador(a).saltar(y, k - 1))
+
+
+def _bitset_productos_medios(semilla1, semilla2):
+    """Como _brent, en una sola pasada marcando los 10^8 pares de 4 dígitos en un bitset de 12.5 MB."""
+    visto = bytearray(ESTADOS * ESTADOS // 8)
+    y_prev, y_curr = semilla1, semilla2
+    k = 0
+    while True:
+        # Un par con un valor de más de 4 dígitos (solo las semillas) no puede repetirse
+        if y_prev < ESTADOS and y_curr < ESTADOS:
+            clave = y_prev * ESTADOS + y_curr
+            bit = 1 << (clave & 7)
+            if visto[clave >> 3] & bit:
+                break
+            visto[clave >> 3] |= bit
+        y_prev, y_curr = y_curr, paso_productos_medios(y_prev, y_curr)[1]
+        k += 1
+    # El par repetido (paso k = mu + lam) está en el ciclo: se mide el periodo
+    lam = 1
+    a, b = y_curr, paso_productos_medios(y_prev, y_curr)[1]
+    while (a, b) != (y_prev, y_curr):
+        a, b = b, paso_productos_medios(a, b)[1]
+        lam += 1
+    return k - lam, lam
+
+
+def ciclo_productos_medios(semilla1, semilla2, digitos=DIGITOS, bitset=False):
+    """Cola (mu) y periodo (lam) de los pares (Z_k, Z_{k+1}) de productos medios, con Z_0, Z_1 = semillas.
+
+    Por defecto usa el algoritmo de Brent (memoria constante); con bitset=True y D = 4 marca los
+    pares visitados en un bitset de 12.5 MB, que termina en una sola pasada.
+    """
+    semilla1, semilla2, digitos = int(semilla1), int(semilla2), validar_digitos(digitos)
+    if bitset and digitos == DIGITOS:
+        return _bitset_productos_medios(semilla1, semilla2)
+    return _brent((semilla1, semilla2), lambda par: (par[1], paso_productos_medios(*par, digitos)[1]))
+
+
+def estado_productos_medios(semilla1, semilla2, k, digitos=DIGITOS):
+    """Par (Y_prev, Y_curr) de productos medios tras k pasos, en O(min(k, cola + periodo))."""
+    k = _validar_salto(k)
+    # El espacio de pares (10^8) es demasiado grande para tablas de duplicación:
+    # se avanza por la órbita y, si el ciclo se cierra antes de k, con aritmética modular
+    return _avanzar((int(semilla1), int(semilla2)), k,
+                    lambda par: (par[1], paso_productos_medios(*par, digitos)[1]))
+
+
+def longitud_util_productos_medios(semilla1, semilla2, inicio=0, digitos=DIGITOS, ciclo=None):
+    """Cuántos X_i (desde 'inicio') cubren la cola y una vuelta del ciclo; después solo se repiten.
+
+    ciclo es el par (mu, lam) de ciclo_productos_medios si ya se calculó (no se vuelve a buscar).
+    """
+    mu, lam = ciclo if ciclo is not None else ciclo_productos_medios(semilla1, semilla2, digitos, bitset=True)
+    # X_i = Z_{inicio+i+1} y Z_j es periódica a partir de j = mu
+    return max(mu - (int(inicio) + 2), 0) + lam
+
+
+def _como_arreglo(valores, digitos):
+    # Con D > 18 los estados ya no caben en int64
+    return np.array(valores, dtype=np.int64 if digitos <= 18 else object)
+
+
+def _orbita_tabla(y, tabla):
+    """Desde el estado y recorre la tabla de sucesores y devuelve (cola, ciclo) como arreglos."""
+    sucesor = tabla.tolist()
+    visita = [-1] * len(sucesor)
+    orden = []
+    while visita[y] < 0:
+        visita[y] = len(orden)
+        orden.append(y)
+        y = sucesor[y]
+    mu = visita[y]
+    orden = np.array(orden, dtype=np.int64)
+    return orden[:mu], orden[mu:]
+
+
+def _orbita_funcion(y, siguiente, digitos, limite=None, valor=None):
+    """Como _orbita_tabla, pero para 10^D estados sin tabla (diccionario de estados visitados).
+
+    Recorre a lo más 'limite' estados: si el ciclo no se cierra antes, todos quedan en la cola
+    (basta para los primeros 'limite' valores). valor(estado) da el X_i de cada estado.
+    """
+    visita = {}
+    orden = []
+    while y not in visita and (limite is None or len(orden) < limite):
+        visita[y] = len(orden)
+        orden.append(y)
+        y = siguiente(y)
+    mu = visita.get(y, len(orden))
+    if valor is not None:
+        orden = [valor(estado) for estado in orden]
+    orden = _como_arreglo(orden, digitos)
+    return orden[:mu], orden[mu:]
+
+
+def orbita_cuadrados_medios(semilla, inicio=0, digitos=DIGITOS, n=None):
+    """Cola y ciclo de la sucesión X_1, X_2, ... de cuadrados medios (con n, solo lo que cubren X_1 ... X_n)."""
+    y = paso_cuadrado_medio(estado_cuadrados_medios(semilla, inicio, digitos), digitos)[1]
+    if digitos != DIGITOS:
+        return _orbita_funcion(y, lambda v: paso_cuadrado_medio(v, digitos)[1], digitos, n)
+    return _orbita_tabla(y, tabla_cuadrados_medios())
+
+
+def orbita_multiplicador(a, semilla, inicio=0, digitos=DIGITOS, n=None):
+    """Cola y ciclo de la sucesión X_1, X_2, ... del multiplicador constante (con n, solo lo que cubren X_1 ... X_n)."""
+    a = int(a)
+    y = paso_multiplicador(a, estado_multiplicador(a, semilla, inicio, digitos), digitos)[1]
+    if digitos != DIGITOS:
+        return _orbita_funcion(y, lambda v: paso_multiplicador(a, v, digitos)[1], digitos, n)
+    return _orbita_tabla(y, tabla_multiplicador(a))
+
+
+def orbita_productos_medios(semilla1, semilla2, inicio=0, digitos=DIGITOS, n=None):
+    """Cola y ciclo de la sucesión X_1, X_2, ... de productos medios (con n, solo lo que cubren X_1 ... X_n)."""
+    siguiente = lambda par: (par[1], paso_productos_medios(*par, digitos)[1])
+    # Los estados son los pares (Y_{i-1}, Y_i) y X_i es el segundo de cada par
+    par = siguiente(estado_productos_medios(semilla1, semilla2, inicio, digitos))
+    return _orbita_funcion(par, siguiente, digitos, n, valor=lambda p: p[1])
+
+
+def ponderar_orbita(cola, ciclo, n, digitos=DIGITOS):
+    """Representa los primeros n valores de 'cola + ciclo + ciclo + ...' como (R distintos, repeticiones)."""
+    n = int(n)
+    escala = float(10 ** digitos)
+    if n <= len(cola):
+        return (cola[:n] / escala).astype(float), np.ones(n, dtype=np.int64)
+    vueltas, resto = divmod(n - len(cola), len(ciclo))
+    pesos_ciclo = np.full(len(ciclo), vueltas, dtype=np.int64)
+    pesos_ciclo[:resto] += 1
+    valores = np.concatenate([cola, ciclo])
+    pesos = np.concatenate([np.ones(len(cola), dtype=np.int64), pesos_ciclo])
+    return (valores / escala).astype(float), pesos
+
+
+def muestra_ponderada_cuadrados_medios(semilla, n, inicio=0, digitos=DIGITOS):
+    """R_i de cuadrados medios como (valores, pesos) en O(min(n, cola + periodo)), sin importar el tamaño de n."""
+    return ponderar_orbita(*orbita_cuadrados_medios(semilla, inicio, digitos, n), n, digitos)
+
+
+def muestra_ponderada_multiplicador(a, semilla, n, inicio=0, digitos=DIGITOS):
+    """R_i del multiplicador constante como (valores, pesos) en O(min(n, cola + periodo))."""
+    return ponderar_orbita(*orbita_multiplicador(a, semilla, inicio, digitos, n), n, digitos)
+
+
+def muestra_ponderada_productos_medios(semilla1, semilla2, n, inicio=0, digitos=DIGITOS):
+    """R_i de productos medios como (valores, pesos) en O(min(n, cola + periodo))."""
+    return ponderar_orbita(*orbita_productos_medios(semilla1, semilla2, inicio, digitos, n), n, digitos)
+
+
+def dividir_en_bloques(n, partes):
+    """Divide n iteraciones en bloques contiguos (inicio, longitud) para trabajadores en paralelo."""
+    base, resto = divmod(int(n), int(partes))
+    bloques = []
+    inicio = 0
+    for i in range(int(partes)):
+        longitud = base + (1 if i < resto else 0)
+        if longitud:
+            bloques.append((inicio, longitud))
+        inicio += longitud
+    return bloques
+
+
+def _validar(n, inicio, *enteros):
+    if any(v <= 0 for v in enteros) or n <= 0:
+        raise ValueError("Las semillas, constantes e iteraciones deben ser números positivos.")
+    if inicio < 0:
+        raise ValueError("La iteración inicial no puede ser negativa.")
+
+
+def _iter_tabla(y, sucesor, n, tamano_bloque):
+    """Recorre la tabla de sucesores desde el estado y, entregando bloques (X_i, R_i)."""
+    restantes = n
+    while restantes > 0:
+        m = min(tamano_bloque, restantes)
+        x = np.empty(m, dtype=np.int64)
+        for i in range(m):
+            x[i] = y
+            y = sucesor[y]
+        yield x, x / 10000.0
+        restantes -= m
+
+
+def _iter_paso(y, siguiente, n, tamano_bloque, digitos, valor=None):
+    """Como _iter_tabla, pero calculando cada sucesor con aritmética entera (D distinto de 4).
+
+    Mientras se generan los valores, Brent vigila la órbita: en cuanto el ciclo se cierra, el
+    resto sale de indexar el arreglo del ciclo (int64 con D <= 18), sin más pasos en Python.
+    valor(estado) da el X_i de cada estado (por omisión, el estado mismo).
+    """
+    escala = float(10 ** digitos)
+    como_x = (lambda estados: _como_arreglo(estados, digitos)) if valor is None else (
+        lambda estados: _como_arreglo([valor(e) for e in estados], digitos))
+    ciclo = None
+    vigilar = True
+    tortuga, potencia, lam = y, 1, 0
+    restantes = n
+    while restantes > 0:
+        m = min(tamano_bloque, restantes)
+        if ciclo is None:
+            estados = []
+            for _ in range(m):
+                estados.append(y)
+                y = siguiente(y)
+                if vigilar:
+                    lam += 1
+                    if y == tortuga:
+                        # Desde y la sucesión repite un ciclo de periodo lam; solo conviene
+                        # calcularlo si se van a pedir al menos lam valores más
+                        vigilar = False
+                        if lam <= restantes - len(estados):
+                            ciclo = [y]
+                            for _ in range(lam - 1):
+                                ciclo.append(siguiente(ciclo[-1]))
+                            ciclo = como_x(ciclo)
+                            posicion = 0
+                            break
+                    elif lam == potencia:
+                        tortuga, potencia, lam = y, potencia * 2, 0
+            x = como_x(estados)
+            if len(estados) < m:
+                posicion = m - len(estados)
+                x = np.concatenate([x, ciclo[np.arange(posicion) % lam]])
+                posicion %= lam
+        else:
+            x = ciclo[(posicion + np.arange(m)) % lam]
+            posicion = (posicion + m) % lam
+        yield x, (x / escala).astype(float)
+        restantes -= m
+
+
+def iter_cuadrados_medios(semilla, n, tamano_bloque=TAMANO_BLOQUE, inicio=0, digitos=DIGITOS):
+    """Genera (X_i, R_i) del método de cuadrados medios en bloques, empezando tras 'inicio' pasos."""
+    semilla, n, inicio, digitos = int(semilla), int(n), int(inicio), validar_digitos(digitos)
+    _validar(n, inicio, semilla)
+
+    # El primer paso admite semillas de más de D dígitos; después todo es de D dígitos
+    y = paso_cuadrado_medio(estado_cuadrados_medios(semilla, inicio, digitos), digitos)[1]
+    if digitos != DIGITOS:
+        if cabe_en_int64(digitos):
+            # Vía rápida: el cuadrado de un estado de D dígitos cabe en int64
+            centro = _centrales_int64(digitos)
+            siguiente = lambda v: centro(v * v)
+        else:
+            siguiente = lambda v: paso_cuadrado_medio(v, digitos)[1]
+        yield from _iter_paso(y, siguiente, n, tamano_bloque, digitos)
+        return
+    yield from _iter_tabla(y, tabla_cuadrados_medios().tolist(), n, tamano_bloque)
+
+
+def iter_multiplicador_constante(a, semilla, n, tamano_bloque=TAMANO_BLOQUE, inicio=0, digitos=DIGITOS):
+    """Genera (X_i, R_i) del multiplicador constante en bloques, empezando tras 'inicio' pasos."""
+    a, semilla, n, inicio, digitos = int(a), int(semilla), int(n), int(inicio), validar_digitos(digitos)
+    _validar(n, inicio, a, semilla)
+
+    y = paso_multiplicador(a, estado_multiplicador(a, semilla, inicio, digitos), digitos)[1]
+    if digitos != DIGITOS:
+        if cabe_en_int64(digitos, a):
+            centro = _centrales_int64(digitos, 2 * digitos)
+            siguiente = lambda v: centro(a * v)
+        else:
+            siguiente = lambda v: paso_multiplicador(a, v, digitos)[1]
+        yield from _iter_paso(y, siguiente, n, tamano_bloque, digitos)
+        return
+    yield from _iter_tabla(y, tabla_multiplicador(a).tolist(), n, tamano_bloque)
+
+
+def iter_productos_medios(semilla1, semilla2, n, tamano_bloque=TAMANO_BLOQUE, inicio=0, digitos=DIGITOS,
+                          hasta_ciclo=False):
+    """Genera (X_i, R_i) del método de productos medios en bloques, empezando tras 'inicio' pasos.
+
+    Con hasta_ciclo=True se detiene en cuanto la sucesión degenera (cola + una vuelta del ciclo).
+    """
+    semilla1, semilla2, n, inicio = int(semilla1), int(semilla2), int(n), int(inicio)
+    digitos = validar_digitos(digitos)
+    _validar(n, inicio, semilla1, semilla2)
+    if hasta_ciclo:
+        n = min(n, longitud_util_productos_medios(semilla1, semilla2, inicio, digitos))
+
+    # Los estados son los pares (Y_{i-1}, Y_i) y X_i es el segundo de cada par
+    if cabe_en_int64(digitos):
+        centro = _centrales_int64(digitos)
+        siguiente = lambda par: (par[1], centro(par[0] * par[1]))
+    else:
+        siguiente = lambda par: (par[1], paso_productos_medios(*par, digitos)[1])
+    par = siguiente(estado_productos_medios(semilla1, semilla2, inicio, digitos))
+    yield from _iter_paso(par, siguiente, n, tamano_bloque, digitos, valor=lambda p: p[1])
+
+
+def _enteros(valores):
+    """Semillas o constantes (escalar, lista o arreglo) como enteros de Python, sin pasar por float64."""
+    return np.array([int(v) for v in np.asarray(valores, dtype=object).ravel()], dtype=object)
+
+
+def _paso_seguro(paso, paso_arr, *columnas):
+    """Aplica un paso a columnas de semillas; las que no caben en int64 se resuelven con enteros de Python.
+
+    paso_arr es None cuando 10^D ya no cabe en int64 (D > 18): entonces todo va por 'paso'.
+    """
+    columnas = [_enteros(c).tolist() for c in columnas]
+    if paso_arr is not None and all(v <= _LIMITE_INT64 for c in columnas for v in c):
+        return paso_arr(*(np.array(c, dtype=np.int64) for c in columnas))
+    return np.array([paso(*valores)[1] for valores in zip(*columnas)], dtype=object)
+
+
+def _paso_python(paso, *columnas):
+    """Paso elemento a elemento con enteros de Python cuando el producto no cabe en int64."""
+    return np.array([paso(*(int(v) for v in valores))[1] for valores in zip(*columnas)], dtype=object)
+
+
+def _validar_multi(n, *columnas):
+    if int(n) <= 0 or any(v <= 0 for c in columnas for v in _enteros(c)):
+        raise ValueError("Las semillas, constantes e iteraciones deben ser números positivos.")
+    return int(n)
+
+
+def _resultado_multi(x, digitos):
+    x = x.astype(np.int64) if digitos <= 18 else x
+    return x, (x / float(10 ** digitos)).astype(float)
+
+
+def cuadrados_medios_multi(semillas, n, digitos=DIGITOS):
+    """Avanza muchas semillas a la vez; devuelve (X, R) con forma (semillas, n)."""
+    n = _validar_multi(n, semillas)
+    digitos = validar_digitos(digitos)
+    paso = partial(paso_cuadrado_medio, digitos=digitos)
+    paso_arr = partial(paso_cuadrado_medio_arr, digitos=digitos) if digitos <= 18 else None
+    y = _paso_seguro(paso, paso_arr, semillas)
+    x = np.empty((len(y), n), dtype=object if not cabe_en_int64(digitos) else np.int64)
+    if digitos == DIGITOS:
+        tabla = tabla_cuadrados_medios()
+        y = y.astype(np.int64)
+        for i in range(n):
+            x[:, i] = y
+            y = tabla[y]
+    elif cabe_en_int64(digitos):
+        # Vía rápida: el cuadrado de un estado de D dígitos cabe en int64
+        y = y.astype(np.int64)
+        for i in range(n):
+            x[:, i] = y
+            y = paso_arr(y)
+    else:
+        for i in range(n):
+            x[:, i] = y
+            y = _paso_python(paso, y)
+    return _resultado_multi(x, digitos)
+
+
+def multiplicador_constante_multi(a, semillas, n, digitos=DIGITOS):
+    """Avanza muchas semillas del multiplicador constante a la vez ('a' escalar o una constante por semilla)."""
+    n = _validar_multi(n, a, semillas)
+    digitos = validar_digitos(digitos)
+    paso = partial(paso_multiplicador, digitos=digitos)
+    paso_arr = partial(paso_multiplicador_arr, digitos=digitos) if digitos <= 18 else None
+    semillas = _enteros(semillas)
+    constantes = np.broadcast_to(_enteros(a), semillas.shape)
+    y = _paso_seguro(paso, paso_arr, constantes, semillas)
+    rapido = cabe_en_int64(digitos, max(int(c) for c in constantes))
+    x = np.empty((len(y), n), dtype=np.int64 if rapido else object)
+    if np.ndim(a) == 0 and digitos == DIGITOS:
+        # Una sola constante: el resto es consulta a la tabla de sucesores
+        tabla = tabla_multiplicador(int(a))
+        y = y.astype(np.int64)
+        for i in range(n):
+            x[:, i] = y
+            y = tabla[y]
+    elif rapido:
+        constantes = constantes.astype(np.int64)
+        y = y.astype(np.int64)
+        for i in range(n):
+            x[:, i] = y
+            y = paso_arr(constantes, y)
+    else:
+        for i in range(n):
+            x[:, i] = y
+            y = _paso_python(paso, constantes, y)
+    return _resultado_multi(x, digitos)
+
+
+def productos_medios_multi(semillas1, semillas2, n, digitos=DIGITOS):
+    """Avanza muchos pares de semillas de productos medios a la vez; devuelve (X, R) con forma (pares, n)."""
+    n = _validar_multi(n, semillas1, semillas2)
+    digitos = validar_digitos(digitos)
+    paso = partial(paso_productos_medios, digitos=digitos)
+    paso_arr = partial(paso_productos_medios_arr, digitos=digitos) if digitos <= 18 else None
+    semillas2 = _enteros(semillas2)
+    rapido = cabe_en_int64(digitos)
+    x = np.empty((len(semillas2), n), dtype=np.int64 if rapido else object)
+    # Los dos primeros pasos aún pueden involucrar semillas grandes
+    x[:, 0] = _paso_seguro(paso, paso_arr, semillas1, semillas2)
+    if n > 1:
+        x[:, 1] = _paso_seguro(paso, paso_arr, semillas2, x[:, 0])
+    for i in range(2, n):
+        if rapido:
+            x[:, i] = paso_arr(x[:, i - 2], x[:, i - 1])
+        else:
+            x[:, i] = _paso_python(paso, x[:, i - 2], x[:, i - 1])
+    return _resultado_multi(x, digitos)
+
+
+def _concatenar(bloques):
+    bloques = list(bloques)
+    x = np.concatenate([b[0] for b in bloques])
+    r = np.concatenate([b[1] for b in bloques])
+    return x, r
+
+
+def cuadrados_medios(semilla, n, inicio=0, digitos=DIGITOS):
+    """Devuelve los arreglos completos (X_i, R_i) del método de cuadrados medios."""
+    return _concatenar(iter_cuadrados_medios(semilla, n, inicio=inicio, digitos=digitos))
+
+
+def multiplicador_constante(a, semilla, n, inicio=0, digitos=DIGITOS):
+    """Devuelve los arreglos completos (X_i, R_i) del multiplicador constante."""
+    return _concatenar(iter_multiplicador_constante(a, semilla, n, inicio=inicio, digitos=digitos))
+
+
+def productos_medios(semilla1, semilla2, n, inicio=0, digitos=DIGITOS, hasta_ciclo=False):
+    """Devuelve los arreglos completos (X_i, R_i) del método de productos medios."""
+    return _concatenar(iter_productos_medios(semilla1, semilla2, n, inicio=inicio, digitos=digitos,
+                                             hasta_ciclo=hasta_ciclo))
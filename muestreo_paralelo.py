@@ -0,0 +1,126 @@
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from metodos_clasicos import TAMANO_BLOQUE
+from transformada_cdf import inversa_weibull
+
+# Muestreo de las distribuciones repartido entre procesos: la muestra se divide en partes de
+# tamaño fijo, cada parte usa su propio flujo hijo (SeedSequence.spawn) y el proceso que la
+# genera la escribe directamente en el arreglo final, un .npy mapeado en memoria que comparten
+# todos los procesos: no se serializan resultados ni se copia la muestra.
+
+# Valores por parte: el reparto de flujos depende solo de n, no del número de procesos,
+# así que la misma semilla da la misma muestra en cualquier máquina
+TAMANO_PARTE = 1 << 21
+# A partir de este n las ventanas generan en paralelo (por debajo no compensa lanzar procesos)
+UMBRAL_PARALELO = 4_000_000
+# Carpeta en RAM para el arreglo compartido donde existe (Linux); si no, la temporal del sistema
+CARPETA_COMPARTIDA = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def muestra(generador, distribucion, parametros, m):
+    """m valores con un Generator: distribucion es el nombre de su método (p. ej. "gamma")."""
+    if distribucion == "weibull":
+        # Transformada inversa sobre U[0,1) (sin scipy, un solo paso vectorizado)
+        return inversa_weibull(generador.random(m), parametros["alpha"], parametros["beta"])
+    return getattr(generador, distribucion)(size=m, **parametros)
+
+
+def _llenar_parte(ruta, inicio, fin, secuencia, distribucion, parametros):
+    """Trabajador: genera [inicio, fin) con su flujo y lo escribe en el .npy compartido."""
+    destino = np.load(ruta, mmap_mode="r+")
+    generador = np.random.default_rng(secuencia)
+    for a in range(inicio, fin, TAMANO_BLOQUE):
+        b = min(a + TAMANO_BLOQUE, fin)
+        destino[a:b] = muestra(generador, distribucion, parametros, b - a)
+    destino.flush()
+    del destino
+    return fin - inicio
+
+
+def _borrar(ruta):
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass  # Windows no borra un archivo aún mapeado; queda en la carpeta temporal
+
+
+class MuestraParalela:
+    """Generación de n valores repartida entre procesos.
+
+    'columnas' es el arreglo final (np.memmap), creado antes de empezar: al recorrer el
+    objeto se entregan en orden vistas de las partes ya escritas, y TareaEnSegundoPlano
+    llena directamente esas columnas en lugar de copiarlas a otro arreglo de n valores.
+    Sin 'ruta' el arreglo vive en un archivo temporal que se borra al terminar (en Linux
+    el mapeo sigue siendo válido); con 'ruta' queda guardado como .npy.
+    """
+
+    def __init__(self, distribucion, parametros, n, flujo, procesos=None, ruta=None):
+        self.distribucion = distribucion
+        self.parametros = parametros
+        self.n = int(n)
+        self.procesos = procesos
+        self.secuencias = flujo.secuencias_hijas(len(range(0, self.n, TAMANO_PARTE)))
+        tipo = muestra(np.random.default_rng(0), distribucion, parametros, 0).dtype
+        self.temporal = ruta is None
+        if self.temporal:
+            descriptor, ruta = tempfile.mkstemp(suffix=".npy", dir=CARPETA_COMPARTIDA)
+            os.close(descriptor)
+        self.ruta = ruta
+        self.valores = np.lib.format.open_memmap(ruta, mode="w+", dtype=tipo, shape=(max(self.n, 1),))[:self.n]
+        if self.temporal:
+            # Respaldo (Windows, o si nunca se recorre): se borra cuando ya nadie usa el mapeo
+            weakref.finalize(getattr(self.valores, "_mmap", self.valores), _borrar, ruta)
+
+    @property
+    def columnas(self):
+        return [self.valores]
+
+    def __iter__(self):
+        # Imports diferidos: solo los necesita el modo paralelo, no abrir una ventana
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        limites = list(range(0, self.n, TAMANO_PARTE)) + [self.n]
+        # 'spawn': se llama desde el hilo trabajador de Tk, y hacer fork de un proceso con
+        # varios hilos puede dejar a los hijos bloqueados en locks que tenían otros hilos
+        ejecutor = ProcessPoolExecutor(self.procesos or os.cpu_count(),
+                                       mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futuros = [
+                ejecutor.submit(_llenar_parte, self.ruta, a, b, secuencia, self.distribucion, self.parametros)
+                for a, b, secuencia in zip(limites, limites[1:], self.secuencias)
+            ]
+            for futuro, a, b in zip(futuros, limites, limites[1:]):
+                futuro.result()
+                yield self.valores[a:b]
+        finally:
+            # También al cancelar: se descartan las partes pendientes antes de soltar el archivo
+            ejecutor.shutdown(wait=True, cancel_futures=True)
+            if self.temporal:
+                _borrar(self.ruta)
+
+
+def bloques_en_paralelo(distribucion, parametros, n, flujo, procesos=None):
+    """Fuente de bloques para TareaEnSegundoPlano que escribe en sus propias columnas."""
+    return MuestraParalela(distribucion, parametros, n, flujo, procesos)
+
+
+def muestrear_en_paralelo(distribucion, parametros, n, flujo, procesos=None, ruta=None):
+    """La muestra completa de n valores generada en paralelo (np.memmap; en 'ruta' si se da)."""
+    generacion = MuestraParalela(distribucion, parametros, n, flujo, procesos, ruta)
+    for _ in generacion:
+        pass
+    return generacion.valores
+
+
+def bloques_muestra(distribucion, parametros, n, flujo, procesos=None):
+    """Bloques para generar n valores: en paralelo si n >= UMBRAL_PARALELO, si no con el flujo de la ventana."""
+    if n >= UMBRAL_PARALELO:
+        return bloques_en_paralelo(distribucion, parametros, n, flujo, procesos)
+    # Import diferido: segundo_plano carga tkinter, que los procesos trabajadores no necesitan
+    from segundo_plano import bloques_de
+    return bloques_de(lambda m: muestra(flujo.generador, distribucion, parametros, m), n)
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import gaussian_kde
+from tabla_virtual import TablaVirtual
+from datos import DATOS_ERLANG
+from pruebas_estadisticas import CacheResultados, chi_varianza, chi_uniformidad, texto_sensibilidad, M_FINO
 
 class PruebaKerlandApp:
     def __init__(self, root):
@@ -26,10 +26,10 @@ class PruebaKerlandApp:
         self.media_var = tk.StringVar()
 
         # Datos fijos de k*ERLAND
-        self.datos_fijos = [
-            2.3, 14.2, 2.9, 6.1, 7.2, 5.0, 0.3, 7.1, 5.1, 1.4,
-            5.7, 3.6, 1.3, 3.3, 6.9, 5.8
-        ]
+        self.datos_fijos = list(DATOS_ERLANG)
+
+        # Resultados de las pruebas ya calculados para los datos actuales
+        self.cache_pruebas = CacheResultados()
 
         self.create_widgets()
 
@@ -64,7 +64,7 @@ class PruebaKerlandApp:
         ttk.Button(button_frame, text="❌ Salir", command=self.root.quit, style="TButton").pack(side=tk.LEFT, padx=5)
 
         # Tabla
-        self.tree = ttk.Treeview(
+        self.tree = TablaVirtual(
             self.root,
             columns=("nro", "k_erland", "r_normalizado"),
             show="headings",
@@ -90,37 +90,38 @@ class PruebaKerlandApp:
         ttk.Button(prueba_frame, text="Prueba de Uniformidad", command=self.prueba_uniformidad, style="TButton").pack(side=tk.LEFT, padx=5)
 
     def cargar_datos(self):
+        # Datos nuevos: los resultados anteriores ya no valen
+        self.cache_pruebas.limpiar()
         try:
             # Usar los datos fijos
-            self.valores_originales = self.datos_fijos.copy()
+            # Arreglos NumPy como fuente de verdad para la tabla, las pruebas y las exportaciones
+            self.valores_originales = np.array(self.datos_fijos, dtype=float)
             n = len(self.valores_originales)
 
             # Calcular min y max para normalizar a [0,1]
-            min_val = min(self.valores_originales)
-            max_val = max(self.valores_originales)
+            min_val = self.valores_originales.min()
+            max_val = self.valores_originales.max()
             rango = max_val - min_val
             if rango == 0:
-                self.r_values = [0.0] * n
+                self.r_values = np.zeros(n)
             else:
-                self.r_values = [(x - min_val) / rango for x in self.valores_originales]
+                self.r_values = (self.valores_originales - min_val) / rango
 
             # Actualizar los campos de entrada
             self.k_var.set(str(n))
-            media_calculada = sum(self.valores_originales) / n
+            media_calculada = self.valores_originales.mean()
             self.media_var.set(f"{media_calculada:.1f}")
 
-            # Limpiar y llenar la tabla
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            for i, (x, r) in enumerate(zip(self.valores_originales, self.r_values), 1):
-                self.tree.insert("", tk.END, values=(i, f"{x:.1f}", f"{r:.4f}"))
+            # Llenar la tabla virtual (solo se dibujan las filas visibles)
+            self.tree.cargar(range(1, n + 1), self.valores_originales, self.r_values,
+                             formatos=("", ".1f", ".4f"))
 
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error al cargar los datos: {e}")
 
     def limpiar_tabla(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.limpiar()
+        self.cache_pruebas.limpiar()
         self.k_var.set("")
         self.media_var.set("")
         if hasattr(self, 'valores_originales'):
@@ -131,7 +132,7 @@ class PruebaKerlandApp:
     # === PRUEBAS ESTADÍSTICAS ===
 
     def prueba_medias(self):
-        if not hasattr(self, 'r_values') or not self.r_values:
+        if not hasattr(self, 'r_values') or len(self.r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero carga los datos.")
             return
 
@@ -155,12 +156,9 @@ class PruebaKerlandApp:
         result_text.pack(pady=10, padx=20)
 
         def ejecutar():
-            n = len(self.r_values)
-            media = sum(self.r_values) / n
-            error_estandar = 1 / math.sqrt(12 * n)
-            li_r = 0.5 - z_var.get() * error_estandar
-            ls_r = 0.5 + z_var.get() * error_estandar
-            aceptado = li_r <= media <= ls_r
+            resultado = self.cache_pruebas.evaluar(self.r_values)
+            n, media = resultado.n, resultado.media
+            li_r, ls_r, aceptado = resultado.prueba_medias(z_var.get())
             output = (
                 "Resultados de la Prueba de Medias:\n"
                 f"Número de valores (n): {n}\n"
@@ -185,7 +183,7 @@ class PruebaKerlandApp:
         ttk.Button(btn_frame, text="Volver", command=ventana.destroy, style="TButton").pack(side=tk.LEFT, padx=5)
 
     def prueba_varianza(self):
-        if not hasattr(self, 'r_values') or not self.r_values:
+        if not hasattr(self, 'r_values') or len(self.r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero carga los datos.")
             return
 
@@ -230,33 +228,15 @@ class PruebaKerlandApp:
         result_text.pack(pady=10, padx=20)
 
         def ejecutar():
-            n = len(self.r_values)
-            media = sum(self.r_values) / n
-            varianza_muestra = sum((x - media) ** 2 for x in self.r_values) / (n - 1)
+            resultado = self.cache_pruebas.evaluar(self.r_values)
+            n = resultado.n
             df = n - 1
-            chi_tabla = {
-                1: (0.000157, 3.8415), 2: (0.010025, 5.9915), 3: (0.071721, 7.8147), 4: (0.20700, 9.4877),
-                5: (0.41174, 11.0705), 6: (0.67573, 12.5916), 7: (0.98926, 14.0671), 8: (1.3444, 15.5073),
-                9: (1.7349, 16.9190), 10: (2.1559, 18.3070), 11: (2.6032, 19.6752), 12: (3.0738, 21.0261),
-                13: (3.5650, 22.3620), 14: (4.0747, 23.6848), 15: (4.6009, 24.9958), 16: (5.1422, 26.2962),
-                17: (5.6972, 27.5871), 18: (6.2621, 28.8693), 19: (6.8351, 30.1435), 20: (7.4140, 31.4104),
-                21: (7.9962, 32.6706), 22: (8.5834, 33.9245), 23: (9.1745, 35.1725), 24: (9.7684, 36.4150),
-                25: (10.365, 37.6525), 26: (10.965, 38.8851), 27: (11.568, 40.1133), 28: (12.173, 41.3372),
-                29: (12.781, 42.5569), 30: (13.392, 43.7730)
-            }
             if modo_var.get() == "automático":
-                if df in chi_tabla:
-                    chi_alpha_2 = chi_tabla[df][0]
-                    chi_1_minus_alpha_2 = chi_tabla[df][1]
-                else:
-                    chi_alpha_2 = 0.0
-                    chi_1_minus_alpha_2 = float('inf')
+                chi_alpha_2, chi_1_minus_alpha_2 = chi_varianza(df, confianza_var.get())
             else:
                 chi_alpha_2 = chi_alpha_2_var.get()
                 chi_1_minus_alpha_2 = chi_1_minus_alpha_2_var.get()
-            li_v = chi_alpha_2 / (12 * df)
-            ls_v = chi_1_minus_alpha_2 / (12 * df)
-            aceptado = li_v <= varianza_muestra <= ls_v
+            li_v, ls_v, aceptado = resultado.prueba_varianza(chi_alpha_2, chi_1_minus_alpha_2)
             output = (
                 f"Resultados de la Prueba de Varianza (Modo {modo_var.get().capitalize()}):\n"
                 f"Número de iteraciones (n): {n}\n"
@@ -283,10 +263,13 @@ class PruebaKerlandApp:
         toggle_campos()
 
     def prueba_uniformidad(self):
-        if not hasattr(self, 'r_values') or not self.r_values:
+        if not hasattr(self, 'r_values') or len(self.r_values) == 0:
             messagebox.showwarning("Advertencia", "Primero carga los datos.")
             return
 
+        # Histograma fino: cualquier m que lo divida se agrupa sin volver a recorrer los datos
+        fino = self.cache_pruebas.evaluar(self.r_values, M_FINO)
+
         ventana = tk.Toplevel(self.root)
         ventana.title("Prueba de Uniformidad")
         ventana.geometry("600x700")
@@ -314,16 +297,12 @@ class PruebaKerlandApp:
                 result_text.delete(1.0, tk.END)
                 result_text.insert(tk.END, f"Advertencia: n={n} < m={m}. Resultados pueden no ser confiables.\n\n")
             e = n / m
-            o = [0] * m
-            for r in self.r_values:
-                idx = int(r * m)
-                if idx >= m: idx = m - 1
-                o[idx] += 1
-            chi_cuadrada_calculada = sum((oi - e) ** 2 / e for oi in o)
+            # Frecuencias observadas agrupando el histograma fino
+            resultado = self.cache_pruebas.con_intervalos(fino, self.r_values, m)
+            o = resultado.frecuencias
             df = m - 1
-            chi_tabla = {1: 3.8415, 2: 5.9915, 3: 7.8147, 4: 9.4877, 5: 11.0705, 6: 12.5916, 7: 14.0671, 8: 15.5073, 9: 16.9190, 10: 18.3070}
-            chi_tabla_valor = chi_tabla.get(df, float('inf'))
-            aceptado = chi_cuadrada_calculada <= chi_tabla_valor
+            chi_tabla_valor = chi_uniformidad(df, confianza_var.get())
+            chi_cuadrada_calculada, aceptado = resultado.prueba_uniformidad(chi_tabla_valor)
             output = (
                 "Resultados de la Prueba de Uniformidad (Chi-cuadrada):\n"
                 f"Número de valores (n): {n}\n"
@@ -340,6 +319,7 @@ class PruebaKerlandApp:
             output += f"Grados de libertad: {df}\n"
             output += f"Valor de χ² de la tabla: {chi_tabla_valor:.4f}\n"
             output += ("ACEPTADO" if aceptado else "RECHAZADO")
+            output += texto_sensibilidad(fino, confianza_var.get())
             result_text.delete(1.0, tk.END)
             result_text.insert(tk.END, output)
 
@@ -350,6 +330,10 @@ class PruebaKerlandApp:
         ttk.Button(btn_frame, text="Volver", command=ventana.destroy, style="TButton").pack(side=tk.LEFT, padx=5)
 
     def mostrar_histograma(self, r_values):
+        # matplotlib y scipy solo se cargan cuando se pide un histograma
+        import matplotlib.pyplot as plt
+        from scipy.stats import gaussian_kde
+
         fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
         fig.patch.set_facecolor('#ffffff')
         ax.set_facecolor('#ffffff')
@@ -0,0 +1,380 @@
+import hashlib
+import math
+import os
+import weakref
+from collections import OrderedDict, namedtuple
+from functools import reduce
+
+import numpy as np
+
+from cuantiles import chi2_bilateral, chi2_superior
+from metodos_clasicos import dividir_en_bloques
+
+# Número de intervalos por defecto de la prueba de uniformidad
+M_INTERVALOS = 10
+
+# Resolución del histograma fino: múltiplo de 5, 10, 20, 25, 50, 100, 200, ... (2^4 · 3^2 · 5^2 · 7)
+M_FINO = 25200
+
+# Intervalos de la tabla de sensibilidad de la prueba de uniformidad
+M_SENSIBILIDAD = (5, 10, 20, 25, 50, 100, 200, 400)
+
+# Valores recorridos de una vez: media, M2 y frecuencias se acumulan mientras el bloque está en caché
+BLOQUE_PRUEBAS = 1 << 16
+
+# Tolerancia relativa con la que un R_i se considera exactamente en una frontera k/m
+# (0.6425 * 25200 da 16190.999..., pero 0.6425 * 400 da 257.0)
+TOLERANCIA_FRONTERA = 1e-12
+
+# Nivel de confianza por defecto de las pruebas de varianza y uniformidad
+CONFIANZA = 0.95
+
+PruebaMedias = namedtuple("PruebaMedias", "li ls aceptado")
+PruebaVarianza = namedtuple("PruebaVarianza", "li ls aceptado")
+PruebaUniformidad = namedtuple("PruebaUniformidad", "chi_cuadrada aceptado")
+
+
+def _combinar_momentos(n_a, media_a, m2_a, n_b, media_b, m2_b):
+    """(n, media, M2) de la unión de dos partes (Chan et al.): exacta y estable con tamaños distintos."""
+    total = n_a + n_b
+    if not total:
+        return 0, 0.0, 0.0
+    delta = media_b - media_a
+    media = media_a + delta * n_b / total
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / total
+    return total, media, m2
+
+
+def chi_varianza(df, confianza=CONFIANZA):
+    """(χ²(α/2, df), χ²(1-α/2, df)) para cualquier df, con α = 1 - confianza."""
+    return chi2_bilateral(df, confianza)
+
+
+def chi_uniformidad(df, confianza=CONFIANZA):
+    """Valor de χ²(1-α, df) para la prueba de uniformidad."""
+    return chi2_superior(df, confianza)
+
+
+def indices_intervalos(r, m):
+    """Intervalo (0 ... m-1) de cada R_i, igual para cualquier m.
+
+    Un producto r*m que queda a una tolerancia relativa de un entero k cuenta como la
+    frontera k/m exacta; así el intervalo con m que divide a M_FINO coincide siempre con
+    agrupar el del histograma fino, aunque el redondeo de r*M_FINO caiga del otro lado.
+    """
+    x = r * m
+    k = np.rint(x)
+    indices = np.where(np.abs(x - k) <= TOLERANCIA_FRONTERA * x, k, np.floor(x)).astype(np.int64)
+    # r = 1 cae en el último intervalo
+    return np.minimum(indices, m - 1)
+
+
+class ResultadoPruebas:
+    """Estadísticos de una muestra R_i: n, media, M2 (suma de cuadrados de desviaciones) y frecuencias."""
+
+    def __init__(self, n, media, m2, frecuencias):
+        self.n = n
+        self.media = media
+        self.m2 = m2
+        self.frecuencias = frecuencias
+
+    @property
+    def m(self):
+        return len(self.frecuencias)
+
+    @property
+    def suma(self):
+        return self.media * self.n
+
+    @property
+    def varianza(self):
+        """Varianza muestral (divisor n - 1)."""
+        if self.n < 2:
+            return float('nan')
+        return self.m2 / (self.n - 1)
+
+    @property
+    def esperada(self):
+        return self.n / self.m
+
+    @property
+    def contribuciones(self):
+        """(Oi - Ei)^2 / Ei de cada intervalo."""
+        e = self.esperada
+        return (self.frecuencias - e) ** 2 / e
+
+    @property
+    def chi_cuadrada(self):
+        return float(self.contribuciones.sum())
+
+    def combinar(self, otro):
+        """Resultado de la unión de dos partes de una sucesión (el orden de las partes no importa)."""
+        if otro.m != self.m:
+            raise ValueError("Solo se pueden combinar resultados con el mismo número de intervalos.")
+        n, media, m2 = _combinar_momentos(self.n, self.media, self.m2, otro.n, otro.media, otro.m2)
+        return ResultadoPruebas(n, media, m2, self.frecuencias + otro.frecuencias)
+
+    def reagrupar(self, m):
+        """Mismo resultado con m intervalos, sumando intervalos contiguos (m debe dividir a self.m)."""
+        if self.m % m:
+            raise ValueError(f"{m} intervalos no se obtienen agrupando {self.m}.")
+        return ResultadoPruebas(self.n, self.media, self.m2, self.frecuencias.reshape(m, -1).sum(axis=1))
+
+    def prueba_medias(self, z):
+        error_estandar = 1 / math.sqrt(12 * self.n)
+        li = 0.5 - z * error_estandar
+        ls = 0.5 + z * error_estandar
+        return PruebaMedias(li, ls, li <= self.media <= ls)
+
+    def prueba_varianza(self, chi_alpha_2, chi_1_minus_alpha_2):
+        df = self.n - 1
+        li = chi_alpha_2 / (12 * df)
+        ls = chi_1_minus_alpha_2 / (12 * df)
+        return PruebaVarianza(li, ls, li <= self.varianza <= ls)
+
+    def prueba_uniformidad(self, chi_tabla_valor):
+        chi_cuadrada = self.chi_cuadrada
+        return PruebaUniformidad(chi_cuadrada, chi_cuadrada <= chi_tabla_valor)
+
+
+class AcumuladorPruebas:
+    """Media y M2 (Welford, combinados por bloque) y frecuencias por intervalo, en memoria O(m).
+
+    Se alimenta bloque a bloque con agregar(); nunca guarda los valores, así que sirve
+    para validar sucesiones que no caben en memoria.
+    """
+
+    def __init__(self, m=M_INTERVALOS):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.frecuencias = np.zeros(m, dtype=np.int64)
+
+    @property
+    def m(self):
+        return len(self.frecuencias)
+
+    def agregar(self, r_values, pesos=None):
+        """Suma un bloque de R_i; 'pesos' da las repeticiones de cada valor."""
+        r = np.asarray(r_values, dtype=float)
+        w = None if pesos is None else np.asarray(pesos, dtype=float)
+        for i in range(0, len(r), BLOQUE_PRUEBAS):
+            bloque = r[i:i + BLOQUE_PRUEBAS]
+            self._agregar_bloque(bloque, None if w is None else w[i:i + BLOQUE_PRUEBAS])
+        return self
+
+    def _agregar_bloque(self, bloque, pesos):
+        m = self.m
+        # Un valor fuera de [0, 1] (o NaN) daría un índice negativo o inflaría el último intervalo
+        if len(bloque) and not (bloque.min() >= 0.0 and bloque.max() <= 1.0):
+            raise ValueError("Las pruebas requieren valores R_i en [0, 1]; transforma la muestra primero (CDF).")
+        intervalos = indices_intervalos(bloque, m)
+        if pesos is None:
+            n_b = len(bloque)
+            media_b = float(bloque.mean()) if n_b else 0.0
+            m2_b = float(np.dot(bloque - media_b, bloque - media_b))
+            self.frecuencias += np.bincount(intervalos, minlength=m)
+        else:
+            n_b = int(pesos.sum())
+            media_b = float(np.dot(bloque, pesos)) / n_b if n_b else 0.0
+            m2_b = float(np.dot(pesos, (bloque - media_b) ** 2))
+            self.frecuencias += np.bincount(intervalos, weights=pesos, minlength=m).astype(np.int64)
+        self.n, self.media, self.m2 = _combinar_momentos(self.n, self.media, self.m2, n_b, media_b, m2_b)
+
+    def agregar_resultado(self, resultado):
+        """Suma el resultado parcial de otra parte de la sucesión (p. ej. de otro proceso)."""
+        if resultado.m != self.m:
+            raise ValueError("Solo se pueden combinar resultados con el mismo número de intervalos.")
+        self.n, self.media, self.m2 = _combinar_momentos(self.n, self.media, self.m2,
+                                                         resultado.n, resultado.media, resultado.m2)
+        self.frecuencias += resultado.frecuencias
+        return self
+
+    def resultado(self):
+        return ResultadoPruebas(self.n, self.media, self.m2, self.frecuencias.copy())
+
+
+def evaluar_muestra(r_values, m=M_INTERVALOS, pesos=None):
+    """Media, M2 y frecuencias de m intervalos en una sola pasada vectorizada.
+
+    'pesos' da las repeticiones de cada valor (muestras comprimidas de los métodos clásicos).
+    """
+    return AcumuladorPruebas(m).agregar(r_values, pesos).resultado()
+
+
+def evaluar_bloques(bloques, m=M_INTERVALOS):
+    """Igual que evaluar_muestra, pero consumiendo un generador de bloques (memoria O(m)).
+
+    Cada bloque es un arreglo de R_i o una tupla (x, r) como las de los iter_* de
+    metodos_clasicos; de las tuplas se usa la última columna.
+    """
+    acumulador = AcumuladorPruebas(m)
+    for bloque in bloques:
+        acumulador.agregar(bloque[-1] if isinstance(bloque, tuple) else bloque)
+    return acumulador.resultado()
+
+
+def huella(r_values, pesos=None):
+    """Huella (BLAKE2b) del contenido de la muestra: dos arreglos iguales dan la misma huella."""
+    h = hashlib.blake2b(digest_size=16)
+    for arreglo in (r_values, pesos):
+        if arreglo is None:
+            h.update(b"-")
+            continue
+        arreglo = np.ascontiguousarray(arreglo, dtype=float)
+        h.update(str(arreglo.shape).encode())
+        h.update(memoryview(arreglo).cast("B"))
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """Resultados de evaluar_muestra por (huella de la muestra, m), con descarte LRU.
+
+    Ejecutar, Exportar y volver a abrir una prueba sobre los mismos datos reutilizan el
+    resultado. La huella de cada arreglo se recuerda mientras el arreglo exista, así que
+    repetir la consulta con el mismo objeto no vuelve a recorrer los datos. Cada ventana
+    llama a limpiar() al borrar la tabla o al generar datos nuevos.
+    """
+
+    def __init__(self, capacidad=32):
+        self.capacidad = capacidad
+        self._resultados = OrderedDict()
+        self._huellas = {}
+        self._muestras = {}
+
+    def muestra(self, clave, calcular):
+        """Muestra derivada de los datos actuales (p. ej. su CDF), calculada una vez por clave."""
+        if clave not in self._muestras:
+            self._muestras[clave] = calcular()
+        return self._muestras[clave]
+
+    def _huella(self, r_values, pesos):
+        clave = (id(r_values), id(pesos))
+        guardada = self._huellas.get(clave)
+        if guardada is not None and guardada[0]() is r_values and guardada[1]() is pesos:
+            return guardada[2]
+        valor = huella(r_values, pesos)
+        try:
+            referencias = (weakref.ref(r_values), weakref.ref(pesos) if pesos is not None else lambda: None)
+        except TypeError:
+            return valor  # Listas y otros objetos sin referencias débiles: no se recuerda su huella
+        # Se descartan las huellas de arreglos que ya no existen
+        self._huellas = {k: v for k, v in self._huellas.items() if v[0]() is not None}
+        self._huellas[clave] = referencias + (valor,)
+        return valor
+
+    def evaluar(self, r_values, m=M_INTERVALOS, pesos=None):
+        """Igual que evaluar_muestra, pero sin recalcular lo ya evaluado."""
+        clave = (self._huella(r_values, pesos), m)
+        resultado = self._resultados.get(clave)
+        if resultado is None:
+            resultado = evaluar_muestra(r_values, m, pesos)
+            self._resultados[clave] = resultado
+            if len(self._resultados) > self.capacidad:
+                self._resultados.popitem(last=False)
+        else:
+            self._resultados.move_to_end(clave)
+        return resultado
+
+    def con_intervalos(self, fino, r_values, m, pesos=None):
+        """Como con_intervalos, pero el recuento con un m que no divide al fino también se guarda."""
+        if fino.m % m == 0:
+            return fino.reagrupar(m)
+        return self.evaluar(r_values, m, pesos)
+
+    def limpiar(self):
+        self._resultados.clear()
+        self._huellas.clear()
+        self._muestras.clear()
+
+
+def combinar_resultados(resultados):
+    """Combina los resultados parciales de varias partes en el de la sucesión completa."""
+    return reduce(ResultadoPruebas.combinar, resultados)
+
+
+def _evaluar_parte(fabrica, inicio, longitud, m):
+    return evaluar_bloques(fabrica(longitud, inicio=inicio), m)
+
+
+def evaluar_en_paralelo(fabrica, n, m=M_INTERVALOS, procesos=None):
+    """Reparte n valores entre procesos; cada uno prueba su porción y aquí se combinan.
+
+    fabrica(longitud, inicio=k) devuelve los bloques de los R_i k ... k + longitud - 1,
+    igual que un iter_* de metodos_clasicos con sus primeros argumentos fijados:
+    functools.partial(iter_cuadrados_medios, semilla). Debe poder enviarse a otro
+    proceso (función de módulo o functools.partial, no una lambda).
+    """
+    # Import diferido: las ventanas cargan este módulo y no necesitan el pool de procesos
+    from concurrent.futures import ProcessPoolExecutor
+
+    partes = dividir_en_bloques(n, procesos or os.cpu_count() or 1)
+    if not partes:
+        raise ValueError("El número de iteraciones debe ser positivo.")
+    with ProcessPoolExecutor(max_workers=len(partes)) as ejecutor:
+        futuros = [ejecutor.submit(_evaluar_parte, fabrica, inicio, longitud, m) for inicio, longitud in partes]
+        return combinar_resultados([futuro.result() for futuro in futuros])
+
+
+def con_intervalos(fino, r_values, m, pesos=None):
+    """Resultado con m intervalos a partir del histograma fino; solo se recuenta si m no lo divide."""
+    if fino.m % m == 0:
+        return fino.reagrupar(m)
+    return evaluar_muestra(r_values, m, pesos)
+
+
+def tabla_sensibilidad(fino, confianza=CONFIANZA, intervalos=M_SENSIBILIDAD):
+    """(m, χ² calculado, χ² de la tabla, aceptado) para cada m, sin volver a recorrer los datos.
+
+    Se omiten los m con frecuencia esperada menor que 5, donde la aproximación χ² no vale.
+    """
+    filas = []
+    for m in intervalos:
+        if fino.m % m or fino.n < 5 * m:
+            continue
+        chi_tabla_valor = chi_uniformidad(m - 1, confianza)
+        chi_cuadrada, aceptado = fino.reagrupar(m).prueba_uniformidad(chi_tabla_valor)
+        filas.append((m, chi_cuadrada, chi_tabla_valor, aceptado))
+    return filas
+
+
+def texto_sensibilidad(fino, confianza=CONFIANZA):
+    """Tabla de sensibilidad a m lista para los resultados y las exportaciones."""
+    filas = tabla_sensibilidad(fino, confianza)
+    if not filas:
+        return ""
+    texto = (
+        "\n\nSensibilidad al número de intervalos (m):\n"
+        "m        χ² calculado    χ² de la tabla    Resultado\n"
+        "──────────────────────────────────────────────────────\n"
+    )
+    for m, chi_cuadrada, chi_tabla_valor, aceptado in filas:
+        texto += f"{m:<8} {chi_cuadrada:<15.4f} {chi_tabla_valor:<17.4f} {'ACEPTADO' if aceptado else 'RECHAZADO'}\n"
+    return texto
+
+
+def comprobar_reagrupacion(r_values, pesos=None, intervalos=M_SENSIBILIDAD):
+    """Los m de 'intervalos' en que agrupar el histograma fino no da lo mismo que contar directo."""
+    fino = evaluar_muestra(r_values, M_FINO, pesos)
+    return [m for m in intervalos
+            if not np.array_equal(fino.reagrupar(m).frecuencias, evaluar_muestra(r_values, m, pesos).frecuencias)]
+
+
+# Comprobar que la reagrupación coincide con el conteo directo en mallas y muestras típicas
+if __name__ == "__main__":
+    import sys
+
+    from metodos_clasicos import muestra_ponderada_cuadrados_medios, muestra_ponderada_productos_medios
+
+    casos = {f"malla k/10^{d}": np.arange(10 ** d) / 10 ** d for d in range(1, 7)}
+    casos["malla k/M_FINO"] = np.arange(M_FINO + 1) / M_FINO
+    casos["uniforme"] = np.random.default_rng(0).random(10 ** 6)
+    casos["cuadrados medios"] = muestra_ponderada_cuadrados_medios(1234, 10 ** 6)
+    casos["productos medios"] = muestra_ponderada_productos_medios(1234, 5678, 10 ** 6)
+    fallas = 0
+    for nombre, muestra in casos.items():
+        r_values, pesos = muestra if isinstance(muestra, tuple) else (muestra, None)
+        distintos = comprobar_reagrupacion(r_values, pesos)
+        fallas += bool(distintos)
+        print(f"{nombre}: {'OK' if not distintos else f'difiere con m = {distintos}'}")
+    sys.exit(1 if fallas else 0)
@@ -0,0 +1,123 @@
+import argparse
+import os
+
+import numpy as np
+
+from generadores import iter_bloques
+from metodos_clasicos import TAMANO_BLOQUE
+from pruebas_estadisticas import (evaluar_bloques, M_INTERVALOS, BLOQUE_PRUEBAS, chi_varianza, chi_uniformidad,
+                                  CONFIANZA)
+from cuantiles import valor_z
+from transformada_cdf import cdf_uniforme, cdf_normal, cdf_gamma, cdf_weibull
+
+# Salida a archivos .npy mapeados en memoria: los bloques se escriben directo en el archivo
+# (np.lib.format.open_memmap), así que una muestra nunca tiene que caber completa en RAM, y
+# después se vuelve a abrir sin copiarla (mmap_mode="r") para las pruebas.
+
+
+def guardar_npy(bloques, ruta, n):
+    """Escribe exactamente n valores del generador 'bloques' en el .npy 'ruta'; devuelve n.
+
+    El tipo del arreglo (float, int) se toma del primer bloque. Los bloques pueden ser
+    arreglos o tuplas (x, r) de metodos_clasicos; de las tuplas se guarda la última columna.
+    """
+    n = int(n)
+    if n <= 0:
+        raise ValueError("n debe ser positivo.")
+    destino = None
+    escritos = 0
+    try:
+        for bloque in bloques:
+            bloque = np.asarray(bloque[-1] if isinstance(bloque, tuple) else bloque)
+            if destino is None:
+                destino = np.lib.format.open_memmap(ruta, mode="w+", dtype=bloque.dtype, shape=(n,))
+            m = min(len(bloque), n - escritos)
+            destino[escritos:escritos + m] = bloque[:m]
+            escritos += m
+            if escritos == n:
+                break
+        if escritos < n:
+            raise ValueError(f"Solo se recibieron {escritos} de {n} valores.")
+        destino.flush()
+    except BaseException:
+        # Un archivo a medias (ceros al final) no debe confundirse con una muestra válida
+        if destino is not None:
+            del destino
+            os.remove(ruta)
+        raise
+    del destino
+    return escritos
+
+
+def abrir_npy(ruta):
+    """La muestra guardada, mapeada en memoria y de solo lectura (sin copiarla a RAM)."""
+    return np.load(ruta, mmap_mode="r")
+
+
+def bloques_npy(ruta, tamano_bloque=BLOQUE_PRUEBAS, transformar=None):
+    """Recorre el archivo en vistas de a lo más tamano_bloque valores.
+
+    transformar(bloque) lleva cada bloque a U[0,1] antes de entregarlo, p. ej.
+    lambda x: cdf_gamma(x, alpha, beta) para una muestra Gamma.
+    """
+    valores = abrir_npy(ruta)
+    for a in range(0, len(valores), tamano_bloque):
+        bloque = valores[a:a + tamano_bloque]
+        yield bloque if transformar is None else transformar(bloque)
+
+
+def evaluar_npy(ruta, m=M_INTERVALOS, transformar=None):
+    """ResultadoPruebas (medias, varianza y uniformidad) de un .npy, con memoria O(m + bloque)."""
+    return evaluar_bloques(bloques_npy(ruta, transformar=transformar), m)
+
+
+# Transformación a U[0,1] de cada método para las pruebas (CDF con sus parámetros); None = ya
+# son R_i. Los métodos ausentes (discretos y datos fijos) no tienen una CDF continua que los
+# lleve a U[0,1), así que --pruebas no aplica a ellos.
+TRANSFORMACIONES = {
+    "cuadrados_medios": lambda **_: None,
+    "productos_medios": lambda **_: None,
+    "multiplicador_constante": lambda **_: None,
+    "uniforme": lambda a, b, **_: lambda x: cdf_uniforme(x, a, b),
+    "uniforme2": lambda minimo, maximo, **_: lambda x: cdf_uniforme(x, minimo, maximo),
+    "normal": lambda mu, sigma, **_: lambda x: cdf_normal(x, mu, sigma),
+    "gamma": lambda alpha, beta, **_: lambda x: cdf_gamma(x, alpha, beta),
+    "weibull": lambda alpha, beta, **_: lambda x: cdf_weibull(x, alpha, beta),
+}
+
+
+def _parametro(texto):
+    nombre, _, valor = texto.partition("=")
+    if not nombre or not valor:
+        raise argparse.ArgumentTypeError("Los parámetros se escriben nombre=valor.")
+    valor = float(valor)
+    return nombre, int(valor) if valor.is_integer() else valor
+
+
+# Generar una muestra directo a disco y, opcionalmente, probarla
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera n valores de un método directo a un archivo .npy.")
+    parser.add_argument("metodo", help="Método de generadores.METODOS (p. ej. cuadrados_medios, gamma)")
+    parser.add_argument("n", type=lambda v: int(float(v)), help="Cantidad de valores (admite 1e9)")
+    parser.add_argument("ruta", help="Archivo .npy de salida")
+    parser.add_argument("-p", "--parametro", type=_parametro, action="append", default=[],
+                        help="Parámetro del método, p. ej. -p semilla=1234 -p alpha=2")
+    parser.add_argument("--tamano-bloque", type=int, default=TAMANO_BLOQUE)
+    parser.add_argument("--pruebas", action="store_true", help="Reabrir el archivo y aplicar las pruebas")
+    parser.add_argument("--m", type=int, default=M_INTERVALOS, help="Intervalos de la prueba de uniformidad")
+    args = parser.parse_args()
+    if args.pruebas and args.metodo not in TRANSFORMACIONES:
+        parser.error(f"--pruebas requiere una salida continua llevable a U[0,1): {', '.join(TRANSFORMACIONES)}.")
+
+    bloques = iter_bloques(args.metodo, args.n, args.tamano_bloque, **dict(args.parametro))
+    print(f"{guardar_npy(bloques, args.ruta, args.n)} valores guardados en '{args.ruta}'")
+
+    if args.pruebas:
+        transformar = TRANSFORMACIONES[args.metodo](**dict(args.parametro))
+        resultado = evaluar_npy(args.ruta, args.m, transformar)
+        li, ls, aceptado = resultado.prueba_medias(valor_z(CONFIANZA))
+        print(f"Medias: media = {resultado.media:.6f}, [{li:.6f}, {ls:.6f}] -> {'aceptada' if aceptado else 'rechazada'}")
+        li, ls, aceptado = resultado.prueba_varianza(*chi_varianza(resultado.n - 1))
+        print(f"Varianza: {resultado.varianza:.6f}, [{li:.6f}, {ls:.6f}] -> {'aceptada' if aceptado else 'rechazada'}")
+        chi, aceptado = resultado.prueba_uniformidad(chi_uniformidad(args.m - 1))
+        print(f"Uniformidad (m = {args.m}): χ² = {chi:.4f} -> {'aceptada' if aceptado else 'rechazada'}")
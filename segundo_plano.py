@@ -0,0 +1,143 @@
+import queue
+import threading
+from tkinter import messagebox
+
+import numpy as np
+
+from metodos_clasicos import TAMANO_BLOQUE
+
+# Cada cuánto revisa el hilo de Tk los bloques que entregó el trabajador
+INTERVALO_MS = 50
+
+_FIN = object()
+
+
+def bloques_de(generar, n, tamano_bloque=TAMANO_BLOQUE):
+    """Parte una generación de n valores en llamadas generar(m) de a lo más tamano_bloque valores."""
+    restantes = int(n)
+    while restantes > 0:
+        m = min(tamano_bloque, restantes)
+        yield generar(m)
+        restantes -= m
+
+
+class Acumulador:
+    """Columnas preasignadas que se llenan bloque a bloque (sin concatenar lo ya recibido).
+
+    'columnas' permite usar arreglos que ya existen (p. ej. los que llenan otros procesos):
+    un bloque que ya está en su lugar dentro de ellos no se vuelve a copiar.
+    """
+
+    def __init__(self, total, columnas=None):
+        self.total = int(total)
+        self.llenos = 0
+        self._columnas = columnas
+
+    def agregar(self, bloque):
+        columnas = bloque if isinstance(bloque, tuple) else (bloque,)
+        columnas = [np.asarray(c) for c in columnas]
+        if self._columnas is None:
+            self._columnas = [np.empty(self.total, dtype=c.dtype) for c in columnas]
+        m = min(len(columnas[0]), self.total - self.llenos)
+        for destino, origen in zip(self._columnas, columnas):
+            destino = destino[self.llenos:self.llenos + m]
+            if m and destino.__array_interface__["data"][0] == origen.__array_interface__["data"][0]:
+                continue
+            destino[:] = origen[:m]
+        self.llenos += m
+
+    def columnas(self):
+        """Vistas de la parte ya recibida de cada columna."""
+        if self._columnas is None:
+            return []
+        return [c[:self.llenos] for c in self._columnas]
+
+
+class TareaEnSegundoPlano:
+    """Genera en un hilo trabajador y entrega los bloques al hilo de Tk con root.after.
+
+    Tk no es seguro entre hilos: el trabajador solo deja bloques en una cola y todo lo
+    que toca widgets (tabla, barra de progreso, mensajes) corre en el hilo principal.
+    """
+
+    def __init__(self, root, barra=None):
+        self.root = root
+        self.barra = barra
+        self._cancelar = None
+        self._cola = None
+
+    @property
+    def ocupada(self):
+        return self._cola is not None
+
+    def iniciar(self, bloques, total, al_avanzar=None, al_terminar=None):
+        """Consume el generador 'bloques' en segundo plano.
+
+        al_avanzar(*columnas) recibe lo acumulado tras cada lote de bloques y
+        al_terminar(*columnas, cancelada=...) lo recibe una vez, al final o al cancelar
+        (si llegó al menos un bloque).
+        """
+        self.cancelar()
+        cola = queue.Queue()
+        cancelar = threading.Event()
+        self._cola, self._cancelar = cola, cancelar
+        # Una fuente que escribe en sus propios arreglos los expone en 'columnas'
+        acumulador = Acumulador(total, getattr(bloques, "columnas", None))
+        self._mostrar_progreso(0)
+
+        def trabajar():
+            try:
+                for bloque in bloques:
+                    if cancelar.is_set():
+                        break
+                    cola.put(bloque)
+                cola.put(_FIN)
+            except Exception as e:
+                cola.put(e)
+
+        threading.Thread(target=trabajar, daemon=True).start()
+        self.root.after(INTERVALO_MS, self._revisar, cola, cancelar, acumulador, al_avanzar, al_terminar)
+
+    def cancelar(self):
+        """Detiene la generación en curso; se conservan los bloques ya recibidos."""
+        if self._cancelar is not None:
+            self._cancelar.set()
+
+    def _revisar(self, cola, cancelar, acumulador, al_avanzar, al_terminar):
+        if cola is not self._cola:
+            return  # Una generación más nueva reemplazó a esta
+        fin = error = None
+        recibidos = False
+        # Se entrega todo lo acumulado como un solo lote para no saturar el bucle de Tk
+        while True:
+            try:
+                bloque = cola.get_nowait()
+            except queue.Empty:
+                break
+            if bloque is _FIN or isinstance(bloque, Exception):
+                fin, error = True, (bloque if bloque is not _FIN else None)
+                break
+            acumulador.agregar(bloque)
+            recibidos = True
+            if cancelar.is_set():
+                fin = True
+                break
+
+        if error is not None:
+            self._cola = self._cancelar = None
+            self._mostrar_progreso(0)
+            messagebox.showerror("Error", f"Ocurrió un error: {error}")
+            return
+        if recibidos and not fin and al_avanzar is not None:
+            al_avanzar(*acumulador.columnas())
+        self._mostrar_progreso(acumulador.llenos / acumulador.total if acumulador.total else 1)
+        if fin or (cancelar.is_set() and not recibidos):
+            self._cola = self._cancelar = None
+            if al_terminar is not None and acumulador.llenos:
+                al_terminar(*acumulador.columnas(), cancelada=cancelar.is_set())
+            return
+        self.root.after(INTERVALO_MS, self._revisar, cola, cancelar, acumulador, al_avanzar, al_terminar)
+
+    def _mostrar_progreso(self, fraccion):
+        if self.barra is not None:
+            self.barra["value"] = 100 * fraccion
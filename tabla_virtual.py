@@ -0,0 +1,154 @@
+import tkinter as tk
+from tkinter import ttk
+
+ALTO_FILA = 20
+ALTO_ENCABEZADO = 25
+
+
+class TablaVirtual(ttk.Treeview):
+    """Treeview que solo dibuja las filas visibles; los datos viven en arreglos (NumPy, range, ...).
+
+    Se crea y se configura igual que un ttk.Treeview (heading, column, pack, yview y
+    yscrollcommand), pero en lugar de insertar una fila por número se llama a
+    cargar(columna1, columna2, ...). Cada columna puede ser un arreglo, un range, una
+    función f(i) o un valor constante; 'formatos' da el formato de cada columna.
+    """
+
+    def __init__(self, master=None, **kw):
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self._datos = []
+        self._formatos = []
+        self._total = 0
+        self._inicio = 0
+        self._filas = int(kw.get("height", 10))
+        self._items = []
+
+        self.bind("<Configure>", self._al_redimensionar)
+        self.bind("<MouseWheel>", self._rueda)
+        self.bind("<Button-4>", lambda e: self._desplazar(-3))
+        self.bind("<Button-5>", lambda e: self._desplazar(3))
+        self.bind("<Up>", lambda e: self._desplazar(-1))
+        self.bind("<Down>", lambda e: self._desplazar(1))
+        self.bind("<Prior>", lambda e: self._desplazar(-self._filas))
+        self.bind("<Next>", lambda e: self._desplazar(self._filas))
+        self.bind("<Home>", lambda e: self._ir_a(0))
+        self.bind("<End>", lambda e: self._ir_a(self._total))
+
+    # --- Datos ---
+
+    def cargar(self, *columnas, formatos=None, reiniciar=True):
+        """Reemplaza el contenido de la tabla; no crea ninguna fila fuera de la ventana visible.
+
+        Con reiniciar=False se conserva la posición del scroll (datos que siguen llegando).
+        """
+        self._datos = list(columnas)
+        self._formatos = list(formatos) if formatos is not None else [""] * len(columnas)
+        self._total = max((len(c) for c in columnas if _es_columna(c)), default=0)
+        if reiniciar:
+            self._inicio = 0
+        self._ir_a(self._inicio)
+
+    def limpiar(self):
+        self.cargar()
+
+    @property
+    def total(self):
+        """Número de filas de datos (no de ítems dibujados)."""
+        return self._total
+
+    def columna(self, indice):
+        """Arreglo de datos (sin formato) de una columna."""
+        return self._datos[indice]
+
+    def fila(self, i):
+        """Valores con formato de la fila i (0 = primera)."""
+        return tuple(
+            format(_valor(columna, i), formato)
+            for columna, formato in zip(self._datos, self._formatos)
+        )
+
+    # --- Compatibilidad con Treeview ---
+
+    def configure(self, cnf=None, **kw):
+        if cnf is None and not kw:
+            return super().configure()
+        if isinstance(cnf, dict) and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            self._yscrollcommand = cnf.pop("yscrollcommand")
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+        resultado = super().configure(cnf, **kw) if cnf or kw else None
+        self._notificar_scroll()
+        return resultado
+
+    config = configure
+
+    def yview(self, *args):
+        """Mismo protocolo que Treeview.yview, pero sobre las filas de datos y no sobre los ítems."""
+        if not args:
+            return self._fracciones()
+        if args[0] == "moveto":
+            self._ir_a(int(float(args[1]) * self._total))
+        elif args[0] == "scroll":
+            pasos = int(args[1])
+            self._desplazar(pasos * self._filas if args[2] == "pages" else pasos)
+
+    # --- Dibujo ---
+
+    def _fracciones(self):
+        if not self._total:
+            return 0.0, 1.0
+        return self._inicio / self._total, min(self._inicio + self._filas, self._total) / self._total
+
+    def _notificar_scroll(self):
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fracciones())
+
+    def _ir_a(self, inicio):
+        self._inicio = max(0, min(int(inicio), self._total - self._filas))
+        self._refrescar()
+        return "break"
+
+    def _desplazar(self, filas):
+        return self._ir_a(self._inicio + filas)
+
+    def _rueda(self, evento):
+        # Windows entrega múltiplos de 120; macOS, valores pequeños
+        pasos = -evento.delta // 120 if abs(evento.delta) >= 120 else -evento.delta
+        return self._desplazar(3 * pasos)
+
+    def _al_redimensionar(self, evento):
+        alto_fila = ALTO_FILA
+        encabezado = ALTO_ENCABEZADO
+        if self._items:
+            caja = self.bbox(self._items[0])
+            if caja:
+                encabezado, alto_fila = caja[1], caja[3]
+        filas = max(1, (evento.height - encabezado) // max(alto_fila, 1))
+        if filas != self._filas:
+            self._filas = filas
+            self._ir_a(self._inicio)
+
+    def _refrescar(self):
+        visibles = max(0, min(self._filas, self._total - self._inicio))
+        # Se reutiliza un conjunto fijo de ítems: solo cambian sus valores
+        while len(self._items) > visibles:
+            super().delete(self._items.pop())
+        while len(self._items) < visibles:
+            self._items.append(super().insert("", tk.END))
+        for k, item in enumerate(self._items):
+            super().item(item, values=self.fila(self._inicio + k))
+        self._notificar_scroll()
+
+
+def _es_columna(columna):
+    return hasattr(columna, "__len__") and not isinstance(columna, str)
+
+
+def _valor(columna, i):
+    if callable(columna):
+        return columna(i)
+    if _es_columna(columna):
+        return columna[i]
+    return columna
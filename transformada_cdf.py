@@ -0,0 +1,51 @@
+import numpy as np
+
+# Transformada integral de probabilidad: F(X) ~ U[0,1] si X sigue la distribución F.
+# Cada función recibe el arreglo completo y devuelve otro arreglo; las de forma cerrada
+# solo usan NumPy y scipy.special se carga únicamente cuando no hay fórmula cerrada.
+
+
+def cdf_uniforme(x, a, b):
+    return np.clip((np.asarray(x, dtype=float) - a) / (b - a), 0.0, 1.0)
+
+
+def cdf_exponencial(x, lam):
+    x = np.asarray(x, dtype=float)
+    return np.where(x > 0, -np.expm1(-lam * x), 0.0)
+
+
+def cdf_weibull(x, alpha, beta):
+    """F(x) = 1 - exp(-(x/beta)^alpha), igual que scipy.stats.weibull_min(c=alpha, scale=beta)."""
+    y = np.maximum(np.asarray(x, dtype=float), 0.0) / beta
+    return -np.expm1(-y ** alpha)
+
+
+def inversa_weibull(u, alpha, beta):
+    """F⁻¹(u) = beta * (-ln(1 - u))^(1/alpha): Weibull por transformada inversa desde U[0,1).
+
+    Es la misma distribución que beta * (-ln U)^(1/alpha), pero vale 0 en u = 0, que las
+    fuentes uniformes del proyecto (Generator.random y los R_i clásicos) sí pueden dar.
+    """
+    return beta * (-np.log1p(-np.asarray(u, dtype=float))) ** (1.0 / alpha)
+
+
+def cdf_normal(x, mu, sigma):
+    """CDF Normal(mu, sigma) exacta en doble precisión (scipy.special.ndtr, sin scipy.stats)."""
+    from scipy.special import ndtr
+    return ndtr((np.asarray(x, dtype=float) - mu) / sigma)
+
+
+def cdf_gamma(x, alpha, beta):
+    """CDF Gamma(forma alpha, escala beta); forma cerrada (Erlang) si alpha es entero."""
+    y = np.maximum(np.asarray(x, dtype=float), 0.0) / beta
+    if float(alpha).is_integer() and 0 < alpha <= 50:
+        # P(k, y) = 1 - exp(-y) * sum_{j<k} y^j / j!
+        termino = np.ones_like(y)
+        suma = np.ones_like(y)
+        for j in range(1, int(alpha)):
+            termino = termino * y / j
+            suma += termino
+        return 1.0 - np.exp(-y) * suma
+    # Forma no entera: función gamma incompleta regularizada (sin pasar por scipy.stats)
+    from scipy.special import gammainc
+    return gammainc(alpha, y)